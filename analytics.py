@@ -0,0 +1,95 @@
+# Analytics layer - a typed DataFrame of the awards and the aggregates the Analytics page plots
+#
+# Frames are built once per profile version (see profile_frames) and every
+# aggregate is a vectorized op or groupby over them, so the page stays fast
+# with tens of thousands of rows. Dates are integer month ordinals (dates.py),
+# with year and month columns derived from them arithmetically. Categories
+# come from the award_categories memo, so titles are classified once per
+# version for the Analytics and Achievements pages together.
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+import dates
+from awards import CATEGORY_KEYWORDS, DEFAULT_CATEGORY, award_categories
+from timings import timings
+from versioned_cache import VersionedCache
+
+CATEGORIES = [*CATEGORY_KEYWORDS, DEFAULT_CATEGORY]
+
+ProfileFrames = namedtuple('ProfileFrames', ['awards'])
+
+frames_cache = VersionedCache(maxsize=16)
+
+
+def _column(rows, key):
+    return pd.array([row.get(key) or '' for row in rows], dtype='string')
+
+
+def _ordinals(rows, ordinal):
+    # Month ordinals (dates.py), parsed when the section was decoded
+    return np.fromiter((ordinal(row) for row in rows), dtype=np.int32, count=len(rows))
+
+
+def _year(ordinals):
+    ordinals = ordinals.to_numpy()
+    years = pd.array(ordinals // 16, dtype='Int16')
+    years[(ordinals == dates.NO_DATE) | (ordinals >= dates.PRESENT)] = pd.NA
+    return years
+
+
+def _month(ordinals):
+    ordinals = ordinals.to_numpy()
+    months = pd.array(ordinals % 16, dtype='Int8')
+    months[(months == 0) | (ordinals >= dates.PRESENT)] = pd.NA
+    return months
+
+
+def awards_frame(awards):
+    frame = pd.DataFrame({
+        'title': _column(awards, 'title'),
+        'issuer': _column(awards, 'issuer'),
+        'issued': _ordinals(awards, dates.issued),
+    })
+    frame['year'] = _year(frame['issued'])
+    frame['month'] = _month(frame['issued'])
+    frame['category'] = pd.Categorical(award_categories(awards), categories=CATEGORIES)
+    return frame
+
+
+def build_frames(profile):
+    return ProfileFrames(awards=awards_frame(profile.get('honors_and_awards') or []))
+
+
+def profile_frames(profile, version, profile_key='default'):
+    def timed_build():
+        with timings.measure('analytics.frames.build'):
+            return build_frames(profile)
+    return frames_cache.get_or_build('frames', version, timed_build, profile=profile_key)
+
+
+# -------------------- Aggregates --------------------
+def category_counts(frames):
+    """Awards per category in CATEGORIES order, empty categories left out."""
+    counts = frames.awards['category'].value_counts(sort=False)
+    return {category: int(n) for category, n in counts.items() if n}
+
+
+def award_year_counts(frames):
+    """Awards per year, in year order; awards without a year are skipped."""
+    counts = frames.awards['year'].dropna().value_counts().sort_index()
+    return {int(year): int(n) for year, n in counts.items()}
+
+
+def award_month_counts(frames):
+    """Awards per calendar month (1-12, all twelve present); awards without a month are skipped."""
+    counts = frames.awards['month'].dropna().value_counts().reindex(range(1, 13), fill_value=0)
+    return {int(month): int(n) for month, n in counts.items()}
+
+
+def category_year_table(frames):
+    """Awards per category (rows, CATEGORIES order) and year (columns), zero-filled."""
+    awards = frames.awards.dropna(subset=['year'])
+    table = awards.groupby(['category', 'year'], observed=True).size().unstack(fill_value=0)
+    return table.reindex([c for c in CATEGORIES if c in table.index]).sort_index(axis=1)
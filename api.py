@@ -0,0 +1,268 @@
+# Read-only JSON API - profile sections and the derived views the app computes, over ASGI
+#
+#   python api.py [--host 127.0.0.1] [--port 8502]      (needs uvicorn)
+#   uvicorn api:app --port 8502                          (or any ASGI server)
+#
+# Endpoints (GET or HEAD; ?profile=<slug> selects a profile from PROFILES_DIR,
+# as in the app):
+#   /                          the endpoints and the profile's sections
+#   /profiles                  the slugs that ?profile= accepts (not cached)
+#   /stats                     ProfileStats as an object
+#   /awards/categories         awards per category (categorize_awards), empty categories left out
+#   /certifications/issuers    [{"issuer", "count"}], most certifications first
+#   /sections/<name>           one profile section as loaded, the same with or without a
+#                              snapshot; items carry the fields derived at load
+#                              (<date>_ord, issued_label, description_text on
+#                              experience and projects)
+#
+# Responses are serialized once per (profile, path) and profile version and
+# kept in ``response_cache``; a hit is a dict lookup and a send. Every
+# response has a weak ETag, and a request whose If-None-Match matches gets an
+# empty 304. Clients that accept gzip get a copy compressed once with the body.
+#
+# Only cache hits are served on the event loop. Anything that may touch the
+# disk or take a while (a profile lookup or build, serializing a response)
+# runs in a worker thread, so one cold request does not stall the others.
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import namedtuple
+from dataclasses import asdict
+from urllib.parse import parse_qs
+
+from awards import categorize_awards
+from profile_library import ProfileLibrary
+from profile_watcher import ProfileWatcher, build_profile
+from timings import timings
+from versioned_cache import VersionedCache
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PROFILE_PATH = os.path.join(ROOT, 'profile.json')
+PROFILES_DIR = os.environ.get('PROFILES_DIR', os.path.join(ROOT, 'profiles'))
+PROFILE_CACHE_BYTES = int(os.environ.get('PROFILE_CACHE_BYTES', 256 << 20))
+# Bodies smaller than this are sent as they are even to gzip clients
+GZIP_MIN_BYTES = 1024
+
+# A serialized response: the JSON body, its gzip copy (or None) and the ETag of both
+CachedResponse = namedtuple('CachedResponse', ['body', 'gzipped', 'etag'])
+
+response_cache = VersionedCache(maxsize=512)
+
+
+class ProfileSource:
+    """The default profile (hot-reloaded by a ProfileWatcher) and the profile library, opened on first use."""
+
+    def __init__(self, profile_path=PROFILE_PATH, profiles_dir=PROFILES_DIR):
+        self.profile_path = profile_path
+        self.profiles_dir = profiles_dir
+        self._watcher = None
+        self._library = None
+        self._lock = threading.Lock()
+
+    def watcher(self):
+        with self._lock:
+            if self._watcher is None:
+                self._watcher = ProfileWatcher(self.profile_path, build_profile).start()
+            return self._watcher
+
+    def library(self):
+        with self._lock:
+            if self._library is None:
+                self._library = ProfileLibrary(self.profiles_dir, build_profile, max_bytes=PROFILE_CACHE_BYTES)
+            return self._library
+
+    def watching(self):
+        """Whether the default profile is loaded, so ``get(None)`` is an attribute read."""
+        return self._watcher is not None
+
+    def get(self, slug):
+        """(profile key, LoadedProfile) for ``slug`` (None for the default), or None if there is no such profile."""
+        if not slug:
+            return 'default', self.watcher().current()
+        loaded = self.library().get(slug)
+        return (slug, loaded) if loaded is not None else None
+
+    def close(self):
+        with self._lock:
+            if self._watcher is not None:
+                self._watcher.stop()
+                self._watcher = None
+
+
+# -------------------- Views --------------------
+def _index(loaded, library):
+    return {
+        'endpoints': ['/profiles', '/stats', '/awards/categories', '/certifications/issuers', '/sections/<name>'],
+        'sections': list(loaded.data),
+        'version': loaded.version,
+    }
+
+
+def _profiles(loaded, library):
+    return {'profiles': library.slugs()}
+
+
+def _stats(loaded, library):
+    return asdict(loaded.stats)
+
+
+def _award_categories(loaded, library):
+    categories = categorize_awards(loaded.data.get('honors_and_awards') or [])
+    return {category: awards for category, awards in categories.items() if awards}
+
+
+def _issuers(loaded, library):
+    return [{'issuer': issuer, 'count': count} for issuer, count in loaded.stats.certification_issuers]
+
+
+ROUTES = {
+    '/': _index,
+    '/profiles': _profiles,
+    '/stats': _stats,
+    '/awards/categories': _award_categories,
+    '/certifications/issuers': _issuers,
+}
+SECTION_PREFIX = '/sections/'
+# Not tied to the profile version (profiles can be added at any time), so never cached
+UNCACHED = {'/profiles'}
+
+
+def _view(path, loaded):
+    """The view function serving ``path`` for this profile, or None for a 404."""
+    if path in ROUTES:
+        return ROUTES[path]
+    if path.startswith(SECTION_PREFIX):
+        name = path[len(SECTION_PREFIX):]
+        if name in loaded.data:
+            return lambda loaded, library: loaded.data[name]
+    return None
+
+
+# -------------------- Responses --------------------
+def encode(value):
+    """Serialize a view once: compact JSON, its gzip copy if worth it, and a weak ETag."""
+    body = json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8')
+    gzipped = gzip.compress(body, compresslevel=6, mtime=0) if len(body) >= GZIP_MIN_BYTES else None
+    # Weak: the identity and gzip bodies are the same representation
+    etag = f'W/"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+    return CachedResponse(body, gzipped, etag)
+
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match comparison (weak, as RFC 9110 requires for it)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    opaque = etag.removeprefix('W/')
+    return any(candidate.strip().removeprefix('W/') == opaque for candidate in if_none_match.split(','))
+
+
+def _accepts_gzip(accept_encoding):
+    for coding in accept_encoding.split(','):
+        name, _, params = coding.strip().partition(';')
+        if name.strip().lower() == 'gzip':
+            return params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+    return False
+
+
+async def _send(send, status, headers, body=b''):
+    await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def _send_error(send, status, message, headers=()):
+    body = json.dumps({'error': message}).encode('utf-8')
+    await _send(send, status, [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode()),
+                               (b'cache-control', b'no-store'), *headers], body)
+
+
+class ProfileAPI:
+    """The ASGI application; ``source`` is where profiles come from (a ProfileSource)."""
+
+    def __init__(self, source=None, cache=response_cache):
+        self.source = source if source is not None else ProfileSource()
+        self.cache = cache
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+        elif scope['type'] == 'http':
+            await self._http(scope, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                # Load the default profile before the first request arrives
+                await asyncio.to_thread(self.source.get, None)
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await asyncio.to_thread(self.source.close)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _resolve(self, slug):
+        if not slug and self.source.watching():
+            return self.source.get(None)
+        # Library lookups stat the file and may build the profile
+        return await asyncio.to_thread(self.source.get, slug)
+
+    async def _http(self, scope, send):
+        method = scope['method']
+        if method not in ('GET', 'HEAD'):
+            await _send_error(send, 405, 'read-only API: use GET or HEAD', [(b'allow', b'GET, HEAD')])
+            return
+
+        path = scope['path'].rstrip('/') or '/'
+        query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+        resolved = await self._resolve(query.get('profile', [None])[0])
+        if resolved is None:
+            await _send_error(send, 404, 'no such profile')
+            return
+        profile_key, loaded = resolved
+        view = _view(path, loaded)
+        if view is None:
+            await _send_error(send, 404, f'no such resource: {path}')
+            return
+
+        def build():
+            with timings.measure('api.render'):
+                return encode(view(loaded, self.source.library()))
+        if path in UNCACHED:
+            response = await asyncio.to_thread(build)
+        else:
+            response = self.cache.get(path, loaded.version, profile=profile_key)
+            if response is None:
+                response = await asyncio.to_thread(
+                    self.cache.get_or_build, path, loaded.version, build, profile_key)
+
+        headers = {name.decode('latin-1').lower(): value.decode('latin-1') for name, value in scope['headers']}
+        common = [(b'etag', response.etag.encode()), (b'cache-control', b'no-cache'), (b'vary', b'Accept-Encoding')]
+        if etag_matches(headers.get('if-none-match'), response.etag):
+            await _send(send, 304, common)
+            return
+
+        body = response.body
+        headers_out = [(b'content-type', b'application/json; charset=utf-8'), *common]
+        if response.gzipped is not None and _accepts_gzip(headers.get('accept-encoding', '')):
+            body = response.gzipped
+            headers_out.append((b'content-encoding', b'gzip'))
+        headers_out.append((b'content-length', str(len(body)).encode()))
+        await _send(send, 200, headers_out, b'' if method == 'HEAD' else body)
+
+
+app = ProfileAPI()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8502)
+    args = parser.parse_args()
+    import uvicorn
+    uvicorn.run(app, host=args.host, port=args.port, log_level='warning')
@@ -0,0 +1,126 @@
+# Award classification - keyword tables and a compiled multi-pattern matcher
+from types import MappingProxyType
+
+from memo import memoized_view, profile_memo
+
+# Achievement Categories - keywords for classification
+CATEGORY_KEYWORDS = {
+    "Sports": [
+        "boxing", "biceps", "curl", "powerlifting", "martial", "muai thai", "hand-to-hand",
+        "fighting", "sport", "IPC", "NPA", "IPAF", "asia cup", "champion", "titans"
+    ],
+    "Science": [
+        "astronomy", "astrophysics", "IAAC", "physics", "chemistry", "biology", "math",
+        "IYMC", "lomonosov", "electron", "experimental", "kolmogorov", "biotechnology"
+    ],
+    "Technology": [
+        "google", "microsoft", "hackathon", "hackerrank", "hashcode", "codejam",
+        "kickstart", "yandex", "data challenge", "AI", "zaintech", "programming", "code", "euler"
+    ],
+    "Entrepreneurship": [
+        "ICE24", "united nations", "startup", "carso", "choice of country", "payit",
+        "digital bridge", "business"
+    ],
+    "Academic": [
+        "dean's list", "research scholar", "undergraduate", "RIT", "ambassador"
+    ],
+    "Chess": [
+        "chess", "arena", "FIDE", "candidate master", "legends"
+    ]
+}
+
+DEFAULT_CATEGORY = "Extra"
+
+
+class KeywordClassifier:
+    """Aho-Corasick automaton over lowercased keywords.
+
+    Each state carries the lowest category index of any keyword ending there
+    (directly or through its fail chain), so a single scan of a title yields
+    the same first-category-wins answer as checking categories in order.
+    """
+
+    def __init__(self, category_keywords, default=DEFAULT_CATEGORY):
+        self.categories = list(category_keywords)
+        self.default = default
+        no_match = len(self.categories)
+
+        goto = [{}]
+        rank = [no_match]
+        for index, keywords in enumerate(category_keywords.values()):
+            for keyword in keywords:
+                state = 0
+                for ch in keyword.lower():
+                    nxt = goto[state].get(ch)
+                    if nxt is None:
+                        goto.append({})
+                        rank.append(no_match)
+                        nxt = len(goto) - 1
+                        goto[state][ch] = nxt
+                    state = nxt
+                rank[state] = min(rank[state], index)
+
+        # Breadth-first pass: resolve fail links into a dense transition table
+        # (transitions back to the root are left implicit) and fold each
+        # state's fail-chain rank into its own.
+        delta = [dict(goto[0])]
+        delta.extend({} for _ in range(len(goto) - 1))
+        fail = [0] * len(goto)
+        queue = list(goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            table = dict(delta[fail[state]])
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0)
+                table[ch] = nxt
+                queue.append(nxt)
+            delta[state] = table
+            rank[state] = min(rank[state], rank[fail[state]])
+
+        self._delta = delta
+        self._rank = rank
+        self._no_match = no_match
+
+    def _scan(self, text):
+        delta = self._delta
+        rank = self._rank
+        best = self._no_match
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            r = rank[state]
+            if r < best:
+                best = r
+                if best == 0:
+                    break
+        return best
+
+    def classify(self, title):
+        best = self._scan((title or '').lower())
+        return self.categories[best] if best < self._no_match else self.default
+
+    def classify_many(self, titles):
+        categories = self.categories + [self.default]
+        scan = self._scan
+        return [categories[scan((title or '').lower())] for title in titles]
+
+
+award_classifier = KeywordClassifier(CATEGORY_KEYWORDS)
+
+
+# Derived views - memoized by the content hash of the awards section. Results
+# are shared across sessions, so they are read-only: a tuple of categories in
+# section order, and a mapping of category -> tuple of awards built from it.
+@memoized_view(profile_memo, 'award_categories')
+def award_categories(awards):
+    return tuple(award_classifier.classify_many([award.get('title', '') for award in awards]))
+
+
+@memoized_view(profile_memo, 'categorized_awards')
+def categorize_awards(awards):
+    categories = {cat: [] for cat in list(CATEGORY_KEYWORDS.keys()) + [DEFAULT_CATEGORY]}
+    for award, category in zip(awards, award_categories(awards)):
+        categories[category].append(award)
+    return MappingProxyType({category: tuple(items) for category, items in categories.items()})
@@ -0,0 +1,61 @@
+# Benchmark: Analytics aggregates as Python loops vs. the pandas layer in analytics.py
+#
+#   python benchmarks/bench_analytics.py [--scales 1,10,100,1000]
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import analytics
+from awards import CATEGORY_KEYWORDS, DEFAULT_CATEGORY, award_classifier
+
+from synthetic import synthetic_profile
+
+
+# The year and category aggregates as the Analytics page computed them before
+# (issuers come from ProfileStats in both versions)
+def loop_aggregates(profile):
+    awards = profile['honors_and_awards']
+    categories = {cat: 0 for cat in [*CATEGORY_KEYWORDS, DEFAULT_CATEGORY]}
+    for category in award_classifier.classify_many([a.get('title', '') for a in awards]):
+        categories[category] += 1
+    years = {}
+    for award in awards:
+        match = re.search(r'20\d{2}', award.get('issued_date', ''))
+        if match:
+            year = int(match.group())
+            years[year] = years.get(year, 0) + 1
+    return categories, dict(sorted(years.items()))
+
+
+def frame_aggregates(frames):
+    return (analytics.category_counts(frames), analytics.award_year_counts(frames),
+            analytics.category_year_table(frames))
+
+
+def best(fn, repeat):
+    return min(timeit.repeat(fn, number=1, repeat=repeat)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scales', default='1,10,100,1000')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    for scale in (float(s) for s in args.scales.split(',')):
+        profile = synthetic_profile(scale)
+        frames = analytics.build_frames(profile)
+        loops = best(lambda: loop_aggregates(profile), args.repeat)
+        build = best(lambda: analytics.build_frames(profile), args.repeat)
+        aggregate = best(lambda: frame_aggregates(frames), args.repeat)
+        print(f"scale={scale:<6g} awards={len(profile['honors_and_awards']):<7} "
+              f"loops {loops:8.2f} ms  frames: build {build:8.2f} ms (once per version)  "
+              f"aggregates incl. heatmap {aggregate:7.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+# Benchmark: JSON API throughput, driving the ASGI app in-process (no sockets)
+#
+#   python benchmarks/bench_api.py [--requests 20000]
+#
+# Per endpoint: a cold request (serialized and cached), then requests served
+# from the response cache, with gzip, and revalidations answered with 304.
+# Sockets and the HTTP parser of a real server come on top of these numbers.
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import api
+
+PATHS = ['/stats', '/awards/categories', '/certifications/issuers', '/sections/certifications']
+
+
+async def request(app, path, headers=()):
+    sent = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {'type': 'http', 'method': 'GET', 'path': path, 'query_string': b'',
+             'headers': [(name.encode(), value.encode()) for name, value in headers]}
+    await app(scope, receive, send)
+    start, body = sent
+    return start['status'], dict(start['headers']), body['body']
+
+
+async def throughput(app, path, count, headers=()):
+    start = time.perf_counter()
+    for _ in range(count):
+        await request(app, path, headers)
+    return count / (time.perf_counter() - start)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=20000)
+    args = parser.parse_args()
+
+    app = api.ProfileAPI(api.ProfileSource(), cache=api.VersionedCache(maxsize=64))
+    app.source.get(None)
+    try:
+        for path in PATHS:
+            start = time.perf_counter()
+            status, headers, body = await request(app, path)
+            cold = (time.perf_counter() - start) * 1000
+            etag = headers[b'etag'].decode()
+            hit = await throughput(app, path, args.requests)
+            gzipped = await throughput(app, path, args.requests, [('accept-encoding', 'gzip, br')])
+            revalidate = await throughput(app, path, args.requests, [('if-none-match', etag)])
+            print(f"{path:<28} {len(body):7d} B  cold {cold:7.2f} ms  cached {hit:8.0f} req/s  "
+                  f"gzip {gzipped:8.0f} req/s  304 {revalidate:8.0f} req/s")
+    finally:
+        app.source.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
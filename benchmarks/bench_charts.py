@@ -0,0 +1,68 @@
+# Benchmark: Analytics figures rebuilt on every rerun vs. served from the figure cache
+#
+#   python benchmarks/bench_charts.py [--scale N] [--reruns N]
+#
+# Each rerun ships the four figures the way Streamlit does (to_dict + JSON);
+# the uncached run also builds them first, as the page did before charts.py.
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import analytics
+import charts
+from profile_stats import compute_profile_stats
+from timings import timings
+
+from synthetic import synthetic_profile
+
+
+def aggregates(profile):
+    frames = analytics.build_frames(profile)
+    stats = compute_profile_stats(profile)
+    return {
+        'categories': lambda: charts.category_pie(analytics.category_counts(frames)),
+        'award_years': lambda: charts.award_year_bar(analytics.award_year_counts(frames)),
+        'issuers': lambda: charts.issuer_bar(stats.certification_issuers[:8]),
+        'category_years': lambda: charts.category_year_heatmap(analytics.category_year_table(frames)),
+    }
+
+
+def rerun(builders, cached, version):
+    for name, build in builders.items():
+        if cached:
+            fig = charts.cached_figure(name, version, build)
+        else:
+            with timings.measure(f'chart.{name}.build'):
+                fig = build()
+        charts.figure_json(fig)
+
+
+def report(label, reruns):
+    stats = timings.stats()
+    build = sum(s['total_ms'] for name, s in stats.items() if name.endswith('.build'))
+    serialize = stats['chart.serialize']['total_ms']
+    print(f"  {label:<9} build {build / reruns:8.2f} ms/rerun  "
+          f"serialize {serialize / reruns:6.2f} ms/rerun  total {(build + serialize) / reruns:8.2f} ms/rerun")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=float, default=1)
+    parser.add_argument('--reruns', type=int, default=50)
+    args = parser.parse_args()
+
+    builders = aggregates(synthetic_profile(args.scale))
+    rerun(builders, cached=False, version='warmup')  # plotly validator imports
+    print(f"scale={args.scale:g}  reruns={args.reruns}")
+    for label, cached in (('uncached', False), ('cached', True)):
+        timings.reset()
+        charts.figure_cache.invalidate()
+        for _ in range(args.reruns):
+            rerun(builders, cached, version='v1')
+        report(label, args.reruns)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+# Benchmark: compiled award classifier vs. the original nested keyword loop
+#
+#   python benchmarks/bench_classifier.py [--titles N] [--extra-keywords N]
+import argparse
+import json
+import os
+import random
+import string
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from awards import CATEGORY_KEYWORDS, KeywordClassifier
+
+
+# The original per-title classifier from app.py
+def categorize_award_loop(title, category_keywords):
+    title_lower = title.lower()
+    for category, keywords in category_keywords.items():
+        for keyword in keywords:
+            if keyword.lower() in title_lower:
+                return category
+    return "Extra"
+
+
+def random_word(rng):
+    return ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+
+
+def build_inputs(n_titles, extra_keywords, seed=7):
+    rng = random.Random(seed)
+    profile_path = os.path.join(os.path.dirname(__file__), '..', 'profile.json')
+    with open(profile_path, 'r', encoding='utf-8') as f:
+        real_titles = [a.get('title', '') for a in json.load(f).get('honors_and_awards', [])]
+
+    keywords = {cat: list(kws) for cat, kws in CATEGORY_KEYWORDS.items()}
+    cats = list(keywords)
+    for _ in range(extra_keywords):
+        keywords[rng.choice(cats)].append(f"{random_word(rng)} {random_word(rng)}")
+
+    titles = [rng.choice(real_titles) + ' ' + random_word(rng) for _ in range(n_titles)]
+    return keywords, titles
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--titles', type=int, default=5000)
+    parser.add_argument('--extra-keywords', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    keywords, titles = build_inputs(args.titles, args.extra_keywords)
+    n_keywords = sum(len(v) for v in keywords.values())
+
+    compile_time = min(timeit.repeat(lambda: KeywordClassifier(keywords), number=1, repeat=args.repeat))
+    classifier = KeywordClassifier(keywords)
+
+    expected = [categorize_award_loop(t, keywords) for t in titles]
+    assert classifier.classify_many(titles) == expected, "classifier disagrees with the keyword loop"
+
+    loop_time = min(timeit.repeat(lambda: [categorize_award_loop(t, keywords) for t in titles],
+                                  number=1, repeat=args.repeat))
+    compiled_time = min(timeit.repeat(lambda: classifier.classify_many(titles), number=1, repeat=args.repeat))
+
+    print(f"titles={len(titles)} keywords={n_keywords}")
+    print(f"  keyword loop      {loop_time * 1000:9.2f} ms")
+    print(f"  compiled matcher  {compiled_time * 1000:9.2f} ms  (compile {compile_time * 1000:.2f} ms)")
+    print(f"  speedup           {loop_time / compiled_time:9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
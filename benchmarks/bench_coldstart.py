@@ -0,0 +1,106 @@
+# Benchmark: cold start - import time and first render of each page in a fresh interpreter
+#
+#   python benchmarks/bench_coldstart.py [--pages home,analytics] [--runs N] [--check] [--json report.json]
+#
+# Every measurement runs in a new Python process, so nothing is imported or
+# cached yet: it is what a freshly started worker pays before a page appears.
+# The heavy modules each page pulled in are listed too. --check fails if a
+# page other than Analytics imports pandas or plotly.express, which only the
+# Analytics view is supposed to load.
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+from bench_pages import APP_PATH, PAGES
+
+HEAVY_MODULES = ['pandas', 'numpy', 'plotly.express', 'plotly.io', 'pyarrow']
+# Imported by the Analytics view only (streamlit itself already imports plotly.graph_objects)
+ANALYTICS_ONLY = ['pandas', 'plotly.express']
+
+_CHILD = '''
+import json, os, sys, time
+# First renders without the thumbnail fetch
+os.environ['THUMBNAIL_PREFETCH'] = '0'
+start = time.perf_counter()
+import streamlit
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+at = AppTest.from_file({app!r}, default_timeout=300)
+at.session_state['current_page'] = {page!r}
+at.run()
+rendered = time.perf_counter()
+print(json.dumps({{
+    'import_streamlit_ms': (imported - start) * 1000,
+    'first_render_ms': (rendered - imported) * 1000,
+    'error': str(at.exception[0].value) if at.exception else None,
+    'heavy_modules': [m for m in {heavy!r} if m in sys.modules],
+}}))
+'''
+
+
+def _run(code):
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return time.perf_counter() - start, proc.stdout
+
+
+def import_cost(module, runs):
+    """Wall time of a fresh interpreter importing ``module``, minus a bare interpreter."""
+    bare = statistics.median(_run('pass')[0] for _ in range(runs))
+    return statistics.median(_run(f'import {module}')[0] for _ in range(runs)) - bare
+
+
+def cold_page(page, runs):
+    samples = []
+    for _ in range(runs):
+        wall, out = _run(_CHILD.format(app=APP_PATH, page=page, heavy=HEAVY_MODULES))
+        sample = json.loads(out.strip().splitlines()[-1])
+        if sample['error']:
+            raise RuntimeError(f"{page}: {sample['error']}")
+        samples.append(dict(sample, process_ms=wall * 1000))
+    return {
+        'page': page,
+        'process_ms': statistics.median(s['process_ms'] for s in samples),
+        'import_streamlit_ms': statistics.median(s['import_streamlit_ms'] for s in samples),
+        'first_render_ms': statistics.median(s['first_render_ms'] for s in samples),
+        'heavy_modules': samples[-1]['heavy_modules'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--pages', default=','.join(PAGES))
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--check', action='store_true')
+    parser.add_argument('--json', help='write the report to this path')
+    args = parser.parse_args()
+
+    modules = {module: import_cost(module, args.runs) * 1000 for module in ('pandas', 'plotly.express')}
+    print("fresh-interpreter import cost: " + ', '.join(f"{m} {ms:.0f} ms" for m, ms in modules.items()))
+
+    results = []
+    for page in args.pages.split(','):
+        result = cold_page(page, args.runs)
+        results.append(result)
+        print(f"  {page:<13} process {result['process_ms']:7.0f} ms  import streamlit "
+              f"{result['import_streamlit_ms']:6.0f} ms  first render {result['first_render_ms']:6.0f} ms  "
+              f"heavy: {', '.join(result['heavy_modules']) or '-'}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'import_ms': modules, 'results': results}, f, indent=2)
+        print(f"report written to {args.json}")
+
+    if args.check:
+        leaks = [(r['page'], m) for r in results if r['page'] != 'analytics'
+                 for m in ANALYTICS_ONLY if m in r['heavy_modules']]
+        if leaks:
+            sys.exit('analytics-only modules imported by other pages: '
+                     + ', '.join(f"{page}: {module}" for page, module in leaks))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+# Benchmark: component templates vs. the inline f-string cards they replaced
+#
+#   python benchmarks/bench_components.py [--scale N]
+import argparse
+import os
+import re
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import components as ui
+
+from synthetic import synthetic_profile
+
+_HTML_LINE_BREAKS = re.compile(r'\s*\n\s*')
+
+
+# The award and certification sections as the pages built them before components.py
+def inline_sections(profile):
+    awards_html = []
+    for award in profile['honors_and_awards']:
+        title = award.get('title', '')
+        issuer = award.get('issuer', '')
+        date = award.get('issued_date', '')
+        desc = award.get('description', '')
+        awards_html.append(f'''
+                <div class="card-default">
+                    <div class="text-white" style="font-weight: 500; margin-bottom: 4px;">{title}</div>
+                    <div class="text-muted text-xs">{issuer} {f"· {date}" if date else ""}</div>
+                    {f'<p class="text-muted text-xs" style="margin-top: 8px;">{desc[:120]}...</p>' if desc and len(desc) > 10 else ''}
+                </div>
+                ''')
+    certifications_html = []
+    for cert in profile['certifications']:
+        issued = cert.get('issued_date', '').split(' Credential')[0] if cert.get('issued_date') else ''
+        certifications_html.append(f'''
+            <div class="card-default">
+                <h4 class="text-white" style="margin: 0 0 6px 0; font-size: 0.95rem;">{cert.get('title', '')}</h4>
+                <div class="text-gradient text-sm" style="font-weight: 500;">{cert.get('issuer', '')}</div>
+                <div class="text-muted text-xs">{issued}</div>
+                {f'<div class="font-mono text-xs text-muted" style="margin-top: 6px;">ID: {cert.get("credential", "")}</div>' if cert.get('credential') else ''}
+            </div>
+            ''')
+    tags_html = ""
+    for cert in profile['certifications']:
+        tags_html += f'<span class="tag">{cert.get("issuer", "")} <span class="text-muted">(1)</span></span>'
+    return [_HTML_LINE_BREAKS.sub(' ', html) for html in (
+        ''.join(['<div class="grid-2">', *awards_html, '</div>']),
+        ''.join(['<div class="grid-2">', *certifications_html, '</div>']),
+        tags_html,
+    )]
+
+
+def component_sections(profile):
+    awards = ui.award_cards({
+        'title': award.get('title', ''),
+        'issuer': award.get('issuer', ''),
+        'date': award.get('issued_date', ''),
+        'desc': award.get('description', ''),
+    } for award in profile['honors_and_awards'])
+    certifications = ui.certification_cards({
+        'title': cert.get('title', ''),
+        'issuer': cert.get('issuer', ''),
+        'issued': cert.get('issued_date', '').split(' Credential')[0] if cert.get('issued_date') else '',
+        'credential': cert.get('credential', ''),
+    } for cert in profile['certifications'])
+    tags = ui.tags((cert.get('issuer', ''), 1) for cert in profile['certifications'])
+    return [ui.grid('grid-2', awards), ui.grid('grid-2', certifications), tags]
+
+
+def measure(fn, profile, repeat):
+    elapsed = min(timeit.repeat(lambda: fn(profile), number=1, repeat=repeat))
+    tracemalloc.start()
+    output = fn(profile)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, sum(len(html) for html in output)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=float, default=10)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    profile = synthetic_profile(args.scale)
+    print(f"scale={args.scale:g}  awards={len(profile['honors_and_awards'])}  "
+          f"certifications={len(profile['certifications'])}")
+    results = {name: measure(fn, profile, args.repeat)
+               for name, fn in (('inline f-strings', inline_sections), ('components', component_sections))}
+    base = results['inline f-strings'][0]
+    for name, (elapsed, peak, size) in results.items():
+        print(f"  {name:<17} {elapsed * 1000:8.2f} ms  {base / elapsed:4.1f}x  "
+              f"peak {peak / 1024:8.1f} KiB  output {size / 1024:8.1f} KiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+# Benchmark: per-page allocations and per-session steady-state footprint, with tracemalloc
+#
+#   python benchmarks/bench_memory.py [--scale N] [--reruns N] [--top N] [--json report.json]
+#
+# Each page runs in a fresh AppTest session. The first run's peak and retained
+# bytes are what the page costs the process (caches included). The session
+# is then rerun N times: anything still growing after that, relative to the
+# snapshot taken after the first rerun, is a per-rerun leak, listed by source line.
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from memprofile import line_usage
+
+from bench_pages import APP_PATH, PAGES
+from synthetic import write_synthetic_profile
+
+
+def _traced():
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def bench_page(slug, page, reruns, top, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    base = _traced()
+    tracemalloc.reset_peak()
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    at.query_params['profile'] = slug
+    at.session_state['current_page'] = page
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"{page}: {at.exception[0].value}")
+    first_peak = tracemalloc.get_traced_memory()[1] - base
+    first_retained = _traced() - base
+
+    # One more rerun so per-session state created lazily on the first rerun is settled
+    at.run()
+    settled = _traced()
+    before = tracemalloc.take_snapshot()
+    for _ in range(reruns):
+        at.run()
+    steady = _traced()
+    after = tracemalloc.take_snapshot()
+    return {
+        'page': page,
+        'first_peak_bytes': first_peak,
+        'first_retained_bytes': first_retained,
+        'steady_state_bytes': steady - base,
+        'growth_per_rerun_bytes': (steady - settled) / reruns if reruns else 0,
+        'growth_by_line': [line._asdict() for line in line_usage(before, after, top)],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=float, default=10)
+    parser.add_argument('--pages', default=','.join(PAGES))
+    parser.add_argument('--reruns', type=int, default=20)
+    parser.add_argument('--top', type=int, default=5)
+    parser.add_argument('--timeout', type=float, default=300)
+    parser.add_argument('--json', help='write the report to this path')
+    args = parser.parse_args()
+
+    results = []
+    tracemalloc.start()
+    with tempfile.TemporaryDirectory() as profiles_dir:
+        os.environ['PROFILES_DIR'] = profiles_dir
+        # The prefetch thread's imports (requests, ...) would show up as growth
+        os.environ['THUMBNAIL_PREFETCH'] = '0'
+        slug = f'bench-x{args.scale:g}'
+        write_synthetic_profile(args.scale, os.path.join(profiles_dir, f'{slug}.json'))
+        print(f"scale={args.scale:g}  reruns={args.reruns}")
+        for page in args.pages.split(','):
+            result = bench_page(slug, page, args.reruns, args.top, args.timeout)
+            results.append(result)
+            print(f"  {page:<13} first run: peak {result['first_peak_bytes'] / 1024:9.1f} KiB  "
+                  f"retained {result['first_retained_bytes'] / 1024:9.1f} KiB  | "
+                  f"after {args.reruns} reruns {result['steady_state_bytes'] / 1024:9.1f} KiB  "
+                  f"growth {result['growth_per_rerun_bytes'] / 1024:7.2f} KiB/rerun")
+            for line in result['growth_by_line']:
+                print(f"      {line['size'] / 1024:8.1f} KiB {line['count']:6d} blocks  {line['where']}")
+    tracemalloc.stop()
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'scale': args.scale, 'reruns': args.reruns, 'results': results}, f, indent=2)
+        print(f"report written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+# Benchmark: headless rerun time of every page, driven through Streamlit's AppTest
+#
+#   python benchmarks/bench_pages.py [--scales 1,10,100,1000] [--reruns N] [--json report.json]
+#
+# For each scale a synthetic profile is written to a temporary PROFILES_DIR and
+# selected with ?profile=. Each page gets one cold run (page, figure and frame
+# caches empty for that profile) followed by warm reruns. Wall time, delta count
+# and serialized delta bytes are reported per page; --json writes the same
+# numbers as a machine-readable report for tracking regressions across versions.
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+APP_PATH = os.path.join(ROOT, 'app.py')
+PAGES = ['home', 'career', 'research', 'projects', 'achievements', 'patents', 'analytics']
+
+from synthetic import write_synthetic_profile
+
+
+def _elements(node):
+    children = getattr(node, 'children', None)
+    if children is None:
+        return [node]
+    return [leaf for child in children.values() for leaf in _elements(child)]
+
+
+def _deltas(at):
+    elements = _elements(at._tree)
+    return len(elements), sum(len(e.proto.SerializeToString()) for e in elements if getattr(e, 'proto', None))
+
+
+def bench_page(slug, page, reruns, timeout):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    at.query_params['profile'] = slug
+    at.session_state['current_page'] = page
+
+    start = time.perf_counter()
+    at.run()
+    cold = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(f"{page}: {at.exception[0].value}")
+    deltas, delta_bytes = _deltas(at)
+
+    warm = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        warm.append(time.perf_counter() - start)
+    return {
+        'page': page,
+        'cold_ms': cold * 1000,
+        'rerun_ms': statistics.median(warm) * 1000 if warm else None,
+        'rerun_min_ms': min(warm) * 1000 if warm else None,
+        'deltas': deltas,
+        'delta_bytes': delta_bytes,
+    }
+
+
+def _git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scales', default='1,10,100,1000')
+    parser.add_argument('--pages', default=','.join(PAGES))
+    parser.add_argument('--reruns', type=int, default=5)
+    parser.add_argument('--timeout', type=float, default=300)
+    parser.add_argument('--json', help='write the report to this path')
+    args = parser.parse_args()
+
+    import streamlit
+    report = {
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'streamlit': streamlit.__version__,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'reruns': args.reruns,
+        'results': [],
+    }
+
+    with tempfile.TemporaryDirectory() as profiles_dir:
+        # Read by app.py when the script runs, so it applies to every AppTest below;
+        # thumbnails are not fetched, so no run waits on or allocates for the network
+        os.environ['PROFILES_DIR'] = profiles_dir
+        os.environ['THUMBNAIL_PREFETCH'] = '0'
+        for scale in (float(s) for s in args.scales.split(',')):
+            slug = f'bench-x{scale:g}'
+            path = write_synthetic_profile(scale, os.path.join(profiles_dir, f'{slug}.json'))
+            print(f"scale={scale:g}  profile {os.path.getsize(path) / 1024:.0f} KiB")
+            for page in args.pages.split(','):
+                result = dict(bench_page(slug, page, args.reruns, args.timeout), scale=scale)
+                report['results'].append(result)
+                rerun = f"{result['rerun_ms']:8.1f}" if result['rerun_ms'] is not None else '       -'
+                print(f"  {page:<13} cold {result['cold_ms']:8.1f} ms  rerun {rerun} ms  "
+                      f"{result['deltas']:4d} deltas  {result['delta_bytes'] / 1024:8.1f} KiB")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"report written to {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+# Benchmark: search index build and query latency across profile scales
+#
+#   python benchmarks/bench_search.py [--scales 1,10,100]
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import search
+
+from synthetic import synthetic_profile
+
+QUERIES = ['chess', 'hackathon gold', 'machine learning', 'astana', 'prog', 'international olympiad physics']
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scales', default='1,10,100')
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    for scale in (float(s) for s in args.scales.split(',')):
+        profile = synthetic_profile(scale)
+        build = min(timeit.repeat(lambda: search.build_index(profile), number=1, repeat=3))
+        index = search.build_index(profile)
+        print(f"scale={scale:<5g} docs={len(index):<7} terms={len(index._terms):<7} build {build * 1000:8.1f} ms")
+        for query in QUERIES:
+            elapsed = min(timeit.repeat(lambda: index.search(query, k=8), number=1, repeat=args.repeat))
+            print(f"    {query!r:<34} {elapsed * 1000:7.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# Benchmark: profile startup from JSON vs. from a memory-mapped snapshot
+#
+#   python benchmarks/bench_startup.py [--scale N]
+#
+# "Startup" is what load_profile_data does before the Home page can render:
+# open the profile, compute ProfileStats and produce the cleaned descriptions
+# of the current roles and projects. The clean_html and parse_date memos are
+# cleared before every run, so each one starts cold.
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import dates
+from profile_stats import compute_profile_stats
+from profile_store import LazyProfile
+from snapshot import build_snapshot, open_snapshot
+from textutils import clean_html
+
+from synthetic import write_synthetic_profile
+
+
+def item_text(item, field):
+    text = item.get(f'{field}_text')
+    return text if text is not None else clean_html(item.get(field, ''))
+
+
+def startup(open_fn):
+    profile = open_fn()
+    compute_profile_stats(profile)
+    for section in ('experience', 'projects'):
+        for item in profile.get(section, []):
+            item_text(item, 'description')
+    return profile
+
+
+def cold_caches():
+    # The process-wide memos would otherwise make every run after the first a warm one
+    clean_html.cache_clear()
+    dates.parse_date.cache_clear()
+
+
+def measure(open_fn, repeat):
+    times = []
+    for _ in range(repeat):
+        cold_caches()
+        start = time.perf_counter()
+        startup(open_fn)
+        times.append(time.perf_counter() - start)
+    cold_caches()
+    tracemalloc.start()
+    profile = startup(open_fn)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del profile
+    return min(times), peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=float, default=100)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        profile_path = write_synthetic_profile(args.scale, os.path.join(tmp, 'profile.json'))
+        snapshot_path = build_snapshot(profile_path)
+
+        def full_json():
+            with open(profile_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        paths = [
+            ('json.load', full_json),
+            ('lazy json', lambda: LazyProfile.from_file(profile_path)),
+            ('snapshot', lambda: open_snapshot(snapshot_path, profile_path)),
+        ]
+        print(f"scale={args.scale:g}  profile.json={os.path.getsize(profile_path) / 1e6:.1f} MB  "
+              f"snapshot={os.path.getsize(snapshot_path) / 1e6:.1f} MB")
+        baseline = None
+        for name, open_fn in paths:
+            elapsed, peak = measure(open_fn, args.repeat)
+            baseline = baseline or elapsed
+            print(f"  {name:<10} {elapsed * 1000:9.1f} ms  {baseline / elapsed:5.1f}x  peak {peak / 1e6:7.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+# Benchmark: clean_html before and after the single-pass, truncating rewrite
+#
+#   python benchmarks/bench_textutils.py [--scale N]
+#
+# Cleans every experience and project description at the lengths the pages
+# show them, as a first (cold) render and as a rerun served from the memo.
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from textutils import clean_html
+
+from synthetic import synthetic_profile
+
+
+# clean_html and the Projects emoji pass as they were before
+def old_clean_html(text):
+    if not text:
+        return ""
+    text = re.sub('<[^<]+?>', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    return text.strip()
+
+
+def old_page_texts(profile):
+    return ([old_clean_html(e.get('description', ''))[:350] for e in profile['experience']] +
+            [re.sub(r'[✅🚀🔧📊⚡🧠📈💡🔗]', '', old_clean_html(p.get('description', '')))[:400]
+             for p in profile['projects']])
+
+
+def page_texts(profile):
+    return ([clean_html(e.get('description', ''), 350) for e in profile['experience']] +
+            [clean_html(p.get('description', ''), 400, True) for p in profile['projects']])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--scale', type=float, default=10)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    profile = synthetic_profile(args.scale)
+    text_bytes = sum(len(item.get('description') or '') for item in profile['experience'] + profile['projects'])
+    print(f"scale={args.scale:g}  descriptions={len(profile['experience']) + len(profile['projects'])}  "
+          f"{text_bytes / 1024:.0f} KiB")
+
+    old = min(timeit.repeat(lambda: old_page_texts(profile), number=1, repeat=args.repeat))
+
+    def cold():
+        clean_html.cache_clear()
+        page_texts(profile)
+    new = min(timeit.repeat(cold, number=1, repeat=args.repeat))
+    page_texts(profile)
+    warm = min(timeit.repeat(lambda: page_texts(profile), number=1, repeat=args.repeat))
+    for label, elapsed in (('before', old), ('single pass', new), ('memoized', warm)):
+        print(f"  {label:<12} {elapsed * 1000:8.2f} ms  {old / elapsed:5.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+# Benchmark: thumbnail prefetch against a local HTTP stand-in for the image CDN
+#
+#   python benchmarks/bench_thumbnails.py [--images 40] [--latency-ms 50]
+#
+# A threaded http.server on 127.0.0.1 serves generated JPEGs after a fixed
+# delay, plus a 404 and a body that is not an image. Each run uses a fresh
+# cache directory. Reported: sequential (concurrency 1) vs. concurrent
+# prefetch time, the files stored (duplicates share one), the failures, a
+# second prefetch (nothing to do: failures wait for retry_after), and an offline prefetch against a
+# closed port, which must store nothing and return promptly.
+import argparse
+import asyncio
+import io
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from thumbnails import ThumbnailCache
+
+
+def make_images(count, size=(1600, 1200)):
+    from PIL import Image
+
+    images = []
+    for i in range(count):
+        out = io.BytesIO()
+        Image.new('RGB', size, ((i * 37) % 256, (i * 91) % 256, (i * 53) % 256)).save(out, 'JPEG', quality=85)
+        images.append(out.getvalue())
+    return images
+
+
+def start_server(images, latency):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            name = self.path.strip('/').split('?')[0]
+            if name.startswith('img') and int(name[3:]) < len(images):
+                body, status, content_type = images[int(name[3:])], 200, 'image/jpeg'
+            elif name == 'broken':
+                body, status, content_type = b'<html>not an image</html>', 200, 'text/html'
+            else:
+                body, status, content_type = b'not found', 404, 'text/plain'
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def closed_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def run(urls, concurrency):
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ThumbnailCache(directory, concurrency=concurrency, timeout=2.0)
+        start = time.perf_counter()
+        stored = asyncio.run(cache.prefetch(urls))
+        elapsed = time.perf_counter() - start
+        files = len([name for name in os.listdir(directory) if name.endswith('.webp')])
+        failed = cache.failed
+        start = time.perf_counter()
+        again = asyncio.run(cache.prefetch(urls))
+        warm = time.perf_counter() - start
+        return elapsed, stored, files, failed, again, warm
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--images', type=int, default=40)
+    parser.add_argument('--latency-ms', type=float, default=50)
+    args = parser.parse_args()
+
+    server = start_server(make_images(args.images), args.latency_ms / 1000)
+    base = f'http://127.0.0.1:{server.server_address[1]}'
+    # Every image twice (under a second URL), plus a 404 and a non-image
+    urls = [f'{base}/img{i}' for i in range(args.images)]
+    urls += [f'{base}/img{i}?v=2' for i in range(args.images)] + [f'{base}/missing', f'{base}/broken']
+    try:
+        for concurrency in (1, 8, 16):
+            elapsed, stored, files, failed, again, warm = run(urls, concurrency)
+            print(f"concurrency={concurrency:<3} {len(urls)} urls  {elapsed * 1000:8.1f} ms  stored {stored} urls "
+                  f"as {files} files, {failed} failed  second prefetch: {again} stored in {warm * 1000:.1f} ms")
+    finally:
+        server.shutdown()
+
+    offline = [f'http://127.0.0.1:{closed_port()}/img{i}' for i in range(args.images)]
+    elapsed, stored, files, failed, _, _ = run(offline, 8)
+    print(f"offline      {len(offline)} urls  {elapsed * 1000:8.1f} ms  stored {stored}, {failed} failed")
+
+
+if __name__ == '__main__':
+    main()
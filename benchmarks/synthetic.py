@@ -0,0 +1,53 @@
+# Synthetic profile generator - profile.json-shaped data at N x the real section sizes
+#
+#   python benchmarks/synthetic.py SCALE [OUTPUT]
+import copy
+import json
+import os
+import random
+import sys
+
+PROFILE_PATH = os.path.join(os.path.dirname(__file__), '..', 'profile.json')
+
+
+def load_base_profile(path=PROFILE_PATH):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _vary(item, n, rng):
+    # Keep the shape, make titles distinct so derived views don't collapse
+    item = copy.deepcopy(item)
+    for key in ('title', 'name'):
+        if isinstance(item.get(key), str) and item[key]:
+            item[key] = f"{item[key]} #{n}"
+    date = item.get('date')
+    if isinstance(date, dict) and isinstance(date.get('start_date'), str):
+        date['start_date'] = f"{rng.choice(['Jan', 'Apr', 'Jul', 'Oct'])} {rng.randint(2012, 2025)}"
+    if isinstance(item.get('issued_date'), str) and item['issued_date']:
+        item['issued_date'] = f"{rng.choice(['Feb', 'May', 'Aug', 'Nov'])} {rng.randint(2012, 2025)}"
+    return item
+
+
+def synthetic_profile(scale, base=None, seed=0):
+    """Return a copy of ``base`` with every list section repeated ``scale`` times."""
+    base = base if base is not None else load_base_profile()
+    rng = random.Random(seed)
+    profile = {}
+    for key, value in base.items():
+        if isinstance(value, list) and value and scale != 1:
+            profile[key] = [_vary(value[i % len(value)], i, rng) for i in range(int(len(value) * scale))]
+        else:
+            profile[key] = copy.deepcopy(value)
+    return profile
+
+
+def write_synthetic_profile(scale, path, seed=0):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(synthetic_profile(scale, seed=seed), f, ensure_ascii=False, indent=2)
+    return path
+
+
+if __name__ == '__main__':
+    out = sys.argv[2] if len(sys.argv) > 2 else f"profile_x{sys.argv[1]}.json"
+    print(write_synthetic_profile(float(sys.argv[1]), out))
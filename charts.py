@@ -0,0 +1,136 @@
+# Analytics charts - Plotly figures built once per profile version
+#
+# Building a go.Figure validates every property and dominates the cost of a
+# chart; Streamlit only has to serialize a figure it is handed. The builders
+# take plain aggregates and are cached in ``figure_cache`` under the profile
+# version, so a rerun of the Analytics page reuses the stored figures.
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from dates import MONTHS
+from versioned_cache import VersionedCache
+from timings import timings
+
+figure_cache = VersionedCache(maxsize=32)
+
+_CLEAR = 'rgba(0,0,0,0)'
+_GRID = 'rgba(255,255,255,0.05)'
+CATEGORY_COLORS = ['#f97316', '#8b5cf6', '#3b82f6', '#10b981', '#ec4899', '#6366f1', '#64748b']
+
+
+def category_pie(cat_counts):
+    """Donut of award counts per category; ``cat_counts`` maps category -> count."""
+    fig = go.Figure(data=[go.Pie(
+        labels=list(cat_counts.keys()),
+        values=list(cat_counts.values()),
+        hole=0.5,
+        marker=dict(colors=CATEGORY_COLORS),
+        textfont=dict(color='white'),
+    )])
+    fig.update_layout(
+        plot_bgcolor=_CLEAR,
+        paper_bgcolor=_CLEAR,
+        font=dict(color='white'),
+        height=350,
+        margin=dict(t=20, b=20, l=20, r=20),
+        showlegend=True,
+        legend=dict(orientation="h", y=-0.1, x=0.5, xanchor="center")
+    )
+    return fig
+
+
+def award_year_bar(year_counts):
+    """Awards per year; ``year_counts`` maps year -> count in year order."""
+    counts = list(year_counts.values())
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=list(year_counts.keys()), y=counts,
+        marker=dict(color=counts, colorscale=[[0, '#3b82f6'], [1, '#93c5fd']])
+    ))
+    fig.update_layout(
+        plot_bgcolor=_CLEAR,
+        paper_bgcolor=_CLEAR,
+        font=dict(color='white'),
+        height=350,
+        margin=dict(t=20, b=40, l=40, r=20),
+        xaxis=dict(gridcolor=_GRID),
+        yaxis=dict(gridcolor=_GRID, title="Count")
+    )
+    return fig
+
+
+def award_month_bar(month_counts):
+    """Awards per calendar month; ``month_counts`` maps month (1-12) -> count."""
+    counts = list(month_counts.values())
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=[MONTHS[month - 1] for month in month_counts], y=counts,
+        marker=dict(color=counts, colorscale=[[0, '#10b981'], [1, '#6ee7b7']])
+    ))
+    fig.update_layout(
+        plot_bgcolor=_CLEAR,
+        paper_bgcolor=_CLEAR,
+        font=dict(color='white'),
+        height=300,
+        margin=dict(t=20, b=40, l=40, r=20),
+        xaxis=dict(gridcolor=_GRID, type='category'),
+        yaxis=dict(gridcolor=_GRID, title="Count")
+    )
+    return fig
+
+
+def issuer_bar(issuers):
+    """Horizontal bar of certifications per issuer; ``issuers`` is a sequence of (issuer, count)."""
+    counts = [count for _, count in issuers]
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        y=[issuer for issuer, _ in issuers],
+        x=counts,
+        orientation='h',
+        marker=dict(color=counts, colorscale=[[0, '#818cf8'], [1, '#c4b5fd']])
+    ))
+    fig.update_layout(
+        plot_bgcolor=_CLEAR,
+        paper_bgcolor=_CLEAR,
+        font=dict(color='white'),
+        height=300,
+        margin=dict(t=20, b=40, l=120, r=20),
+        xaxis=dict(gridcolor=_GRID, title="Certifications"),
+        yaxis=dict(gridcolor=_GRID)
+    )
+    return fig
+
+
+def category_year_heatmap(table):
+    """Awards per category and year; ``table`` is analytics.category_year_table()."""
+    fig = go.Figure(data=[go.Heatmap(
+        z=table.to_numpy(),
+        x=[str(year) for year in table.columns],
+        y=list(table.index),
+        colorscale=[[0, 'rgba(99,102,241,0.05)'], [1, '#a78bfa']],
+        hovertemplate='%{y} · %{x}: %{z}<extra></extra>',
+    )])
+    fig.update_layout(
+        plot_bgcolor=_CLEAR,
+        paper_bgcolor=_CLEAR,
+        font=dict(color='white'),
+        height=80 + 36 * len(table.index),
+        margin=dict(t=20, b=40, l=120, r=20),
+        xaxis=dict(gridcolor=_GRID, type='category'),
+        yaxis=dict(gridcolor=_GRID, autorange='reversed')
+    )
+    return fig
+
+
+def cached_figure(chart, version, build, profile='default'):
+    """The figure ``build()`` returns for this profile version, built at most once per version."""
+    def timed_build():
+        with timings.measure(f'chart.{chart}.build'):
+            return build()
+    return figure_cache.get_or_build(chart, version, timed_build, profile=profile)
+
+
+def figure_json(fig):
+    """The compact JSON Streamlit sends for a figure (no re-validation)."""
+    with timings.measure('chart.serialize'):
+        return pio.to_json(fig.to_dict(), validate=False)
@@ -0,0 +1,382 @@
+# HTML components - precompiled templates for the cards, tiles and badges used by every page
+#
+# Each template is written readably below and collapsed to a single line once,
+# at import. Render functions take a batch of rows (dicts of plain values),
+# escape every field exactly once and join the cards in one pass. The output
+# never contains line breaks, so it can go straight to st.markdown.
+import re
+from collections import namedtuple
+from html import escape, unescape
+
+_LINE_BREAKS = re.compile(r'\s*\n\s*')
+
+
+def compile_template(template):
+    return _LINE_BREAKS.sub('', template.strip()).format
+
+
+def text(value):
+    """Escape a field for HTML text content.
+
+    Crawled text may already contain entities (&#x2022;, &amp;), so they are
+    decoded first and every field ends up escaped exactly once. Line breaks
+    become spaces: a rendered component is always a single line, which keeps
+    the markdown parser from ending the HTML block early.
+    """
+    if value is None or value == '':
+        return ''
+    value = str(value)
+    if '&' in value or '<' in value or '>' in value:
+        value = escape(unescape(value), quote=False)
+    if '\n' in value or '\r' in value:
+        value = value.replace('\r', ' ').replace('\n', ' ')
+    return value
+
+
+# -------------------- Layout --------------------
+# Side-by-side Streamlit columns in a rendered page; ``parts`` holds the
+# fragments of each column
+Columns = namedtuple('Columns', ['spec', 'parts'])
+
+# A long card section shown a window at a time. ``rows`` is the full list of
+# card rows, precomputed with the page; ``render`` is the card function that
+# formats a slice of them, so only the visible window is ever turned into HTML.
+# The window size per session is kept by the app (see emit_fragments).
+Paged = namedtuple('Paged', ['key', 'css', 'icon', 'title', 'header', 'grid', 'rows', 'render', 'page_size'])
+
+_SECTION = compile_template('''
+    <div class="{css}">
+        <h2 class="section-header {header}"><span class="section-header-icon">{icon}</span>{title}</h2>
+        {body}
+    </div>
+''')
+
+_GRID = compile_template('<div class="{css}">{body}</div>')
+
+
+def section(css, icon, title, body, header=''):
+    return _SECTION(css=css, header=header, icon=icon, title=text(title), body=body)
+
+
+def grid(css, cards):
+    return _GRID(css=css, body=''.join(cards))
+
+
+def paged_section(paged, shown):
+    return section(paged.css, paged.icon, paged.title, grid(paged.grid, paged.render(paged.rows[:shown])),
+                   header=paged.header)
+
+
+def hero(title, subtitle, floating=False):
+    extra = ' floating' if floating else ''
+    return f'<h1 class="hero-name{extra}">{text(title)}</h1><p class="hero-title">{text(subtitle)}</p>'
+
+
+# -------------------- Metric tiles --------------------
+_METRIC = compile_template('''
+    <div class="metric-card">
+        <div style="font-size: {icon_size};{icon_style}">{icon}</div>
+        <div class="metric-number">{value}</div>
+        <div class="metric-label">{label}</div>
+    </div>
+''')
+
+
+def metric_tiles(stats, icon_size='1.8rem', icon_style=''):
+    """``stats`` is an iterable of (icon, value, label)."""
+    return [_METRIC(icon_size=icon_size, icon_style=icon_style, icon=icon, value=text(value), label=text(label))
+            for icon, value, label in stats]
+
+
+# -------------------- Badges and tags --------------------
+_TAG = compile_template('<span class="tag">{name} <span class="text-muted{note_css}">({note})</span></span>')
+
+
+def tags(items, note_css=''):
+    """``items`` is an iterable of (name, note)."""
+    note_css = f' {note_css}' if note_css else ''
+    return ''.join([_TAG(name=text(name), note=text(note), note_css=note_css) for name, note in items])
+
+
+# -------------------- Elevated cards --------------------
+_ROLE_CARD = compile_template('''
+    <div class="card-elevated">
+        <h4 class="text-white" style="margin: 0 0 6px 0;">{title}</h4>
+        <p class="text-gradient" style="font-weight: 600; margin: 0 0 4px 0;">{company}</p>
+        <span class="badge-success">{start} - Present</span>
+        <p class="text-muted text-sm" style="margin-top: 12px;">{desc}...</p>
+    </div>
+''')
+
+
+def role_cards(rows):
+    return [_ROLE_CARD(title=text(r['title']), company=text(r['company']), start=text(r['start']),
+                       desc=text(r['desc']))
+            for r in rows]
+
+
+_TIMELINE_ITEM = compile_template('''
+    <div class="timeline-item">
+        <div class="timeline-dot"></div>
+        <div class="card-elevated">
+            <div style="display: flex; justify-content: space-between; align-items: start; flex-wrap: wrap; gap: 10px;">
+                <div style="display: flex; align-items: center; gap: 12px;">
+                    {logo}
+                    <div>
+                        <h3 class="text-white" style="margin: 0 0 4px 0; font-size: 1.1rem;">{title}</h3>
+                        <p class="text-gradient" style="font-weight: 600; margin: 0;">{company}</p>
+                    </div>
+                </div>
+                <div style="text-align: right;">
+                    {badge}
+                    <div class="text-muted text-xs" style="margin-top: 4px;">{start} - {end}</div>
+                    {location}
+                </div>
+            </div>
+            {desc}
+        </div>
+    </div>
+''')
+
+
+def timeline_items(rows):
+    items = []
+    for r in rows:
+        end = text(r['end'])
+        items.append(_TIMELINE_ITEM(
+            logo=thumbnail(r.get('logo'), 'timeline-logo'),
+            title=text(r['title']),
+            company=text(r['company']),
+            badge='<span class="badge-success">Current</span>' if r['end'] == 'Present' else f'<span class="badge-info">{end}</span>',
+            start=text(r['start']),
+            end=end,
+            location=f'<div class="text-muted text-xs">📍 {text(r["location"])}</div>' if r['location'] else '',
+            desc=(f'<p class="text-white text-sm" style="margin-top: 14px; line-height: 1.6; opacity: 0.85;">'
+                  f'{text(r["desc"])}...</p>') if r['desc'] else '',
+        ))
+    return items
+
+
+_PROJECT_CARD = compile_template('''
+    <div class="card-elevated">
+        <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 12px;">
+            <h3 class="text-white" style="margin: 0; font-size: 1.05rem; flex: 1;">{name}</h3>
+            {period}
+        </div>
+        <p class="text-white text-sm" style="line-height: 1.7; opacity: 0.85;">{desc}...</p>
+    </div>
+''')
+
+
+def project_cards(rows):
+    return [_PROJECT_CARD(name=text(r['name']), desc=text(r['desc']),
+                          period=f'<span class="badge-success">{text(r["period"])}</span>' if r['period'] else '')
+            for r in rows]
+
+
+# -------------------- Compact cards --------------------
+_COMPACT_CARD = compile_template('''
+    <div class="card-compact"{style}>
+        <div class="text-white text-sm" style="font-weight: 500;">{title}</div>
+        <div class="text-muted text-xs">{subtitle}</div>
+    </div>
+''')
+
+
+def compact_cards(rows, min_height=None):
+    """``rows`` is an iterable of (title, subtitle)."""
+    style = f' style="min-height: {min_height};"' if min_height else ''
+    return [_COMPACT_CARD(style=style, title=text(title), subtitle=text(subtitle)) for title, subtitle in rows]
+
+
+_THUMB_CARD = compile_template('''
+    <div class="card-compact card-thumbed"{style}>
+        {thumb}
+        <div>
+            <div class="text-white text-sm" style="font-weight: 500;">{title}</div>
+            <div class="text-muted text-xs">{subtitle}</div>
+        </div>
+    </div>
+''')
+
+
+def thumbnail(url, css):
+    """A lazily loaded local thumbnail (see thumbnails.py); empty when there is none."""
+    return f'<img class="{css}" src="{escape(url)}" alt="" loading="lazy">' if url else ''
+
+
+def thumb_cards(rows, min_height=None):
+    """Compact cards with a thumbnail; ``rows`` is an iterable of (title, subtitle, thumbnail URL or None)."""
+    style = f' style="min-height: {min_height};"' if min_height else ''
+    return [_THUMB_CARD(style=style, thumb=thumbnail(thumb, 'card-thumb'), title=text(title), subtitle=text(subtitle))
+            for title, subtitle, thumb in rows]
+
+
+_EDUCATION_CARD = compile_template('''
+    <div class="card-compact">
+        <div class="text-white" style="font-weight: 600;">{degree}</div>
+        <div class="text-gradient text-sm">{major}</div>
+        <div class="text-muted text-xs">{school}</div>
+        <div class="text-muted text-xs">{start} - {end}</div>
+    </div>
+''')
+
+
+def education_cards(rows):
+    return [_EDUCATION_CARD(degree=text(r['degree']), major=text(r['major']), school=text(r['school']),
+                            start=text(r['start']), end=text(r['end']))
+            for r in rows]
+
+
+# -------------------- Default cards --------------------
+_AWARD_CARD = compile_template('''
+    <div class="card-default">
+        <div class="text-white" style="font-weight: 500; margin-bottom: 4px;">{title}</div>
+        <div class="text-muted text-xs">{issuer} {date}</div>
+        {desc}
+    </div>
+''')
+
+
+def award_cards(rows):
+    return [_AWARD_CARD(
+        title=text(r['title']),
+        issuer=text(r['issuer']),
+        date=f"· {text(r['date'])}" if r['date'] else '',
+        desc=f'<p class="text-muted text-xs" style="margin-top: 8px;">{text(r["desc"][:120])}...</p>'
+             if r['desc'] and len(r['desc']) > 10 else '',
+    ) for r in rows]
+
+
+_CERTIFICATION_CARD = compile_template('''
+    <div class="card-default">
+        <h4 class="text-white" style="margin: 0 0 6px 0; font-size: 0.95rem;">{title}</h4>
+        <div class="text-gradient text-sm" style="font-weight: 500;">{issuer}</div>
+        <div class="text-muted text-xs">{issued}</div>
+        {credential}
+    </div>
+''')
+
+
+def certification_cards(rows):
+    return [_CERTIFICATION_CARD(
+        title=text(r['title']),
+        issuer=text(r['issuer']),
+        issued=text(r['issued']),
+        credential=f'<div class="font-mono text-xs text-muted" style="margin-top: 6px;">ID: {text(r["credential"])}</div>'
+                   if r['credential'] else '',
+    ) for r in rows]
+
+
+# -------------------- Highlight and patent cards --------------------
+_PUBLICATION_CARD = compile_template('''
+    <div class="card-highlight">
+        <h3 class="text-white" style="margin: 0 0 10px 0; font-size: 1.1rem;">{title}</h3>
+        <div style="margin-bottom: 12px;">
+            <span class="badge-warning">{publisher}</span>
+            {date}
+        </div>
+        <p class="text-white text-sm" style="line-height: 1.7; opacity: 0.85;">{desc}</p>
+    </div>
+''')
+
+
+def publication_cards(rows):
+    return [_PUBLICATION_CARD(
+        title=text(r['title']),
+        publisher=text(r['publisher']),
+        date=f'<span class="text-muted" style="margin-left: 10px;">{text(r["date"])}</span>' if r['date'] else '',
+        desc=text(r['desc']),
+    ) for r in rows]
+
+
+_PATENT_CARD = compile_template('''
+    <div class="patent-card">
+        <h4 class="text-white" style="margin: 0 0 10px 0;">{title}</h4>
+        <div class="patent-id">{patent_id}</div>
+    </div>
+''')
+
+
+def patent_cards(rows):
+    return [_PATENT_CARD(title=text(r['title']), patent_id=text(r['patent_id'])) for r in rows]
+
+
+# -------------------- Page chrome --------------------
+# The sidebar and footer around every page, shared by the app and the static export
+SOCIAL_LINKS = [
+    ('💼', 'LinkedIn', None),
+    ('💻', 'GitHub', 'https://github.com/damn-glitch'),
+    ('🏅', 'Credly', 'https://www.credly.com/users/alisher-beisembekov/badges'),
+]
+
+_SIDEBAR_HEADER = compile_template('''
+    <div class="sidebar-header">
+        <div class="sidebar-name">{name}</div>
+        <div class="sidebar-location">📍 {location}</div>
+    </div>
+''')
+
+_QUICK_STAT = compile_template('''
+    <div style="text-align: center;">
+        <div class="text-gradient" style="font-size: 1.3rem; font-weight: 700;">{value}</div>
+        <div class="text-muted text-xs">{label}</div>
+    </div>
+''')
+
+_QUICK_STATS = compile_template('''
+    <div style="padding: 15px; background: rgba(255,255,255,0.03); border-radius: 12px; margin-bottom: 15px;">
+        <div style="color: rgba(255,255,255,0.5); font-size: 0.75rem; margin-bottom: 8px;">QUICK STATS</div>
+        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 10px;">{stats}</div>
+    </div>
+''')
+
+_SOCIAL = compile_template('''
+    <div style="text-align: center; padding: 15px 0;">
+        <div style="display: flex; justify-content: center; gap: 16px;">{links}</div>
+        <div class="text-muted text-xs" style="margin-top: 10px;">
+            {followers} · {connections}
+        </div>
+    </div>
+''')
+
+_FOOTER = compile_template('''
+    <div style="margin-top: 60px; padding: 30px 0; text-align: center; border-top: 1px solid rgba(255,255,255,0.08);">
+        <p class="text-muted" style="margin-bottom: 15px;">
+            © 2025 {name} · Built with data from LinkedIn
+        </p>
+        <div style="display: flex; justify-content: center; gap: 20px; flex-wrap: wrap;">{links}</div>
+        <p class="text-muted text-xs" style="margin-top: 15px; opacity: 0.5;">
+            Last updated: {crawled_at}
+        </p>
+    </div>
+''')
+
+
+def _social_urls(profile):
+    return [(icon, label, url or profile.get('url') or '#') for icon, label, url in SOCIAL_LINKS]
+
+
+def sidebar_header(profile):
+    return _SIDEBAR_HEADER(name=text(profile.get('name', 'Alisher Beisembekov')),
+                           location=text(profile.get('location', 'Astana, Kazakhstan')))
+
+
+def quick_stats(stats):
+    tiles = [(stats.awards, 'Awards'), (stats.patents, 'Patents'), (stats.projects, 'Projects'),
+             (stats.certifications, 'Certs')]
+    return _QUICK_STATS(stats=''.join(_QUICK_STAT(value=value, label=label) for value, label in tiles))
+
+
+def social_links(profile):
+    links = ''.join(f'<a href="{escape(url)}" target="_blank" style="font-size: 1.3rem; text-decoration: none;">{icon}</a>'
+                    for icon, _, url in _social_urls(profile))
+    return _SOCIAL(links=links, followers=text(profile.get('followers', '')),
+                   connections=text(profile.get('connections', '')))
+
+
+def footer(profile):
+    links = ''.join(f'<a href="{escape(url)}" target="_blank" class="text-muted" style="text-decoration: none;">{label}</a>'
+                    for _, label, url in _social_urls(profile))
+    return _FOOTER(name=text(profile.get('name', 'Alisher Beisembekov')), links=links,
+                   crawled_at=text(profile.get('crawled_at', '')))
@@ -0,0 +1,99 @@
+# Date model - every profile date parsed once into an integer month ordinal
+#
+# Profile dates are free text: "May 2025", "2016", "May 3, 2017", "Present",
+# "Dec 2020 Credential ID ZEDAVFZ6ZC4H", "Jan 2021 · Expires Jan 2024". Each is
+# parsed into ``year * 16 + month``, month 0 when only the year is known, so
+# ordinals sort chronologically and the year and month are an integer division
+# away. ``NO_DATE`` (0) is a missing or unrecognised date and ``PRESENT``
+# sorts after every real one. A ``date`` range without an ``end_date`` is
+# ongoing, as the career timeline shows it, so its end is PRESENT.
+#
+# Sections are annotated when they are decoded (profile_store.LazyProfile):
+# items get ``start_ord``/``end_ord`` from their ``date`` range, ``issued_ord``
+# from ``issued_date`` or ``publication_date``, and ``issued_label``, the
+# issued date without a certification's " Credential ID ..." suffix.
+import functools
+import re
+
+NO_DATE = 0
+PRESENT = 10000 * 16
+
+MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+_MONTH_NUMBERS = {name.lower(): number for number, name in enumerate(MONTHS, 1)}
+
+# An optional month name (and day), then the year; only the first date counts,
+# so "Jan 2021 · Expires Jan 2024" is January 2021
+_DATE = re.compile(r'(?:\b([A-Za-z]{3})[a-z]*\.?\s+(?:\d{1,2},?\s+)?)?\b((?:19|20)\d{2})\b')
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_date(text):
+    """The month ordinal of a free-text date; NO_DATE if there is none."""
+    if not text:
+        return NO_DATE
+    if text.strip() == 'Present':
+        return PRESENT
+    match = _DATE.search(text)
+    if match is None:
+        return NO_DATE
+    month = _MONTH_NUMBERS.get((match.group(1) or '').lower(), 0)
+    return int(match.group(2)) * 16 + month
+
+
+def range_end(date):
+    """The end ordinal of a ``date`` range; PRESENT when it has no end_date."""
+    return parse_date(date['end_date']) if 'end_date' in date else PRESENT
+
+
+def date_label(text):
+    """A date as shown on cards: certification credential IDs cut off."""
+    return text.split(' Credential')[0] if text else ''
+
+
+def annotate(section):
+    """Add the ordinal fields to every item of a decoded section, in place."""
+    if not isinstance(section, list):
+        return section
+    for item in section:
+        if not isinstance(item, dict):
+            continue
+        date = item.get('date')
+        if isinstance(date, dict):
+            item['start_ord'] = parse_date(date.get('start_date'))
+            item['end_ord'] = range_end(date)
+        issued = item.get('issued_date') or item.get('publication_date')
+        if issued is not None:
+            item['issued_ord'] = parse_date(issued)
+            item['issued_label'] = date_label(issued)
+    return section
+
+
+# Accessors that also work on items that were never annotated (plain dicts,
+# e.g. synthetic profiles built in memory)
+def start(item):
+    ordinal = item.get('start_ord')
+    return ordinal if ordinal is not None else parse_date((item.get('date') or {}).get('start_date'))
+
+
+def end(item):
+    ordinal = item.get('end_ord')
+    if ordinal is not None:
+        return ordinal
+    date = item.get('date')
+    return range_end(date) if isinstance(date, dict) else NO_DATE
+
+
+def issued(item):
+    ordinal = item.get('issued_ord')
+    if ordinal is not None:
+        return ordinal
+    return parse_date(item.get('issued_date') or item.get('publication_date'))
+
+
+def issued_label(item):
+    label = item.get('issued_label')
+    return label if label is not None else date_label(item.get('issued_date') or item.get('publication_date'))
+
+
+def is_current(item):
+    return end(item) == PRESENT
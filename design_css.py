@@ -0,0 +1,168 @@
+# Design-system CSS build - styles/design.css -> static/design.min.css
+#
+#   python design_css.py [--check]
+#
+# Rules whose class selectors never appear in the app's Python sources are
+# dropped, as are @keyframes no remaining rule animates with; the rest is
+# minified and written to static/design.min.css, which is committed. The app
+# only reads that file (read_css); building it is this offline step.
+# --check writes nothing and fails if the committed file is out of date with
+# the sources or over SIZE_BUDGET.
+import hashlib
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(ROOT, 'styles', 'design.css')
+OUTPUT_PATH = os.path.join(ROOT, 'static', 'design.min.css')
+# Streamlit serves ./static at app/static when server.enableStaticServing is on
+STATIC_URL = 'app/static/design.min.css'
+SIZE_BUDGET = 12 * 1024
+
+# Loaded with <link> next to the stylesheet rather than an @import inside it,
+# so the font CSS is fetched in parallel instead of after design.min.css
+FONTS_URL = ('https://fonts.googleapis.com/css2?family=Space+Grotesk:wght@300;400;500;600;700'
+             '&family=Outfit:wght@300;400;500;600;700;800&family=JetBrains+Mono:wght@400;500;600&display=swap')
+
+_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CLASS = re.compile(r'\.(-?[_a-zA-Z][\w-]*)')
+_ANIMATION = re.compile(r'animation(?:-name)?\s*:\s*([\w-]+)')
+
+
+def _blocks(css):
+    # Yield (prelude, body) for each top-level block, matching nested braces
+    pos = 0
+    while True:
+        start = css.find('{', pos)
+        if start < 0:
+            return
+        depth, end = 1, start + 1
+        while depth:
+            depth += {'{': 1, '}': -1}.get(css[end], 0)
+            end += 1
+        yield css[pos:start].strip(), css[start + 1:end - 1]
+        pos = end
+
+
+def _minify_selector(selector):
+    selector = ' '.join(selector.split())
+    return re.sub(r'\s*([>+~,])\s*', r'\1', selector)
+
+
+def _minify_body(body):
+    body = ' '.join(body.split())
+    body = re.sub(r'\s*([:;,{}])\s*', r'\1', body).replace(';}', '}')
+    return body.rstrip(';')
+
+
+def _source_dir(dirpath, name):
+    # Hidden directories, virtualenvs and non-app code are not scanned
+    return (not name.startswith('.') and name not in ('benchmarks', '__pycache__', 'venv')
+            and not os.path.exists(os.path.join(dirpath, name, 'pyvenv.cfg')))
+
+
+def used_classes(root=ROOT):
+    """Every identifier-like token in the app's Python sources."""
+    tokens = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if _source_dir(dirpath, d)]
+        for name in filenames:
+            if name.endswith('.py') and name != os.path.basename(__file__):
+                with open(os.path.join(dirpath, name), 'r', encoding='utf-8') as f:
+                    tokens.update(re.findall(r'[\w-]+', f.read()))
+    return tokens
+
+
+def _selector_used(selector, used):
+    # Streamlit's own classes (stApp, stButton, ...) are always on the page
+    return all(cls in used or re.match(r'st[A-Z]', cls) for cls in _CLASS.findall(selector))
+
+
+def _rules(css, used):
+    kept = []
+    for prelude, body in _blocks(css):
+        if prelude.startswith('@keyframes'):
+            kept.append((prelude, body))
+        elif prelude.startswith('@'):
+            inner = _rules(body, used)
+            if inner:
+                kept.append((prelude, inner))
+        else:
+            selectors = [s for s in prelude.split(',') if _selector_used(s, used)]
+            if selectors:
+                kept.append((','.join(selectors), body))
+    return kept
+
+
+def _animations(rules):
+    names = set()
+    for prelude, body in rules:
+        if isinstance(body, list):
+            names |= _animations(body)
+        elif not prelude.startswith('@keyframes'):
+            names.update(_ANIMATION.findall(body))
+    return names
+
+
+def _serialize(rules, animations):
+    out = []
+    for prelude, body in rules:
+        if isinstance(body, list):
+            out.append(f'{" ".join(prelude.split())}{{{_serialize(body, animations)}}}')
+        elif prelude.startswith('@keyframes'):
+            if prelude.split()[1] in animations:
+                out.append(f'{" ".join(prelude.split())}{{{_minify_body(body)}}}')
+        else:
+            out.append(f'{_minify_selector(prelude)}{{{_minify_body(body)}}}')
+    return ''.join(out)
+
+
+def build_css(source_path=SOURCE_PATH, used=None):
+    with open(source_path, 'r', encoding='utf-8') as f:
+        css = _COMMENT.sub('', f.read())
+    rules = _rules(css, used if used is not None else used_classes())
+    return _serialize(rules, _animations(rules))
+
+
+def css_version(css):
+    return hashlib.blake2b(css.encode('utf-8'), digest_size=6).hexdigest()
+
+
+def read_css(path=OUTPUT_PATH):
+    """The committed, built CSS."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def write_css(css, output_path=OUTPUT_PATH):
+    """Write the built CSS if it changed; returns the output path."""
+    try:
+        with open(output_path, 'r', encoding='utf-8') as f:
+            if f.read() == css:
+                return output_path
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(css)
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+if __name__ == '__main__':
+    built = build_css()
+    size = len(built.encode('utf-8'))
+    if '--check' not in sys.argv:
+        print(f"{write_css(built)}: {size} bytes (budget {SIZE_BUDGET})")
+        sys.exit()
+    try:
+        committed = read_css()
+    except OSError:
+        committed = None
+    if committed != built:
+        sys.exit(f"{OUTPUT_PATH} is out of date; run python design_css.py")
+    if size > SIZE_BUDGET:
+        sys.exit(f"design.min.css is {size - SIZE_BUDGET} bytes over budget")
+    print(f"{OUTPUT_PATH}: {size} bytes (budget {SIZE_BUDGET}), up to date")
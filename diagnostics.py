@@ -0,0 +1,69 @@
+# Diagnostics - what one rerun spent its time on and sent, plus the hit rates of every cache
+#
+# The panel is hidden; it shows with ?diagnostics=1 or DIAGNOSTICS=1.
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+from env_flags import env_flag
+from timings import Timings
+
+DIAGNOSTICS = env_flag('DIAGNOSTICS')
+
+CacheRow = namedtuple('CacheRow', ['cache', 'hits', 'misses', 'hit_rate'])
+
+
+class RerunStats:
+    """Step timings and markdown deltas of a single script run.
+
+    app.py creates one at the top of the script, so it is naturally per
+    session and per rerun. Steps are also added to ``history``, a Timings
+    kept in the session, for averages across the session's reruns.
+    """
+
+    def __init__(self, history=None):
+        self.timings = Timings()
+        self.history = history
+        self.deltas = 0
+        self.delta_bytes = 0
+
+    @contextmanager
+    def measure(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timings.record(name, elapsed)
+            if self.history is not None:
+                self.history.record(name, elapsed)
+
+    def count(self, body):
+        self.deltas += 1
+        self.delta_bytes += len(body.encode('utf-8'))
+
+
+def enabled(query_params):
+    return DIAGNOSTICS or query_params.get('diagnostics') in ('1', 'true')
+
+
+def _row(name, hits, misses):
+    total = hits + misses
+    return CacheRow(name, hits, misses, hits / total if total else 0.0)
+
+
+def cache_rows(counters=(), lru=()):
+    """Normalize cache statistics into CacheRows.
+
+    ``counters`` are (name, stats()) with hits and misses; a ``by_name``
+    breakdown (VersionedCache) adds a row per name when there are several.
+    ``lru`` are (name, functools cache_info()).
+    """
+    rows = []
+    for name, stats in counters:
+        rows.append(_row(name, stats['hits'], stats['misses']))
+        by_name = stats.get('by_name', {})
+        if len(by_name) > 1:
+            rows.extend(_row(f'{name} · {key}', s['hits'], s['misses']) for key, s in sorted(by_name.items()))
+    rows.extend(_row(name, info.hits, info.misses) for name, info in lru)
+    return rows
@@ -0,0 +1,16 @@
+# Environment switches - MEMORY_PROFILE, DIAGNOSTICS, THUMBNAIL_PREFETCH
+import os
+
+_OFF = ('', '0', 'false', 'no', 'off')
+
+
+def env_flag(name, default=False):
+    """The on/off switch ``name`` from the environment.
+
+    Unset is ``default``; 0, false, no, off (in any case) and an empty value
+    are off; anything else is on.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() not in _OFF
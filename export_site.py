@@ -0,0 +1,239 @@
+# Static site export - every page rendered once to plain files a file server can host
+#
+#   python export_site.py [profile.json] [output dir, default site/]
+#
+# Layout of the output directory:
+#   index.html, career.html, ...   one standalone page per route (home is index.html)
+#   assets/site.css                the design CSS plus the export's page layout, shared by all pages
+#   assets/plotly.min.js           plotly.js bundled with the installed plotly package
+#   charts/<name>.json             each Analytics figure, drawn client-side by plotly.js
+#   thumbs/<digest>.webp           the cached thumbnails the pages show (see thumbnails.py)
+#
+# Pages are built from the same views and card templates as the app. Paged
+# sections show every row (there is no server to load more), and search,
+# being a server-side index, is left out. Each file gets a gzip copy (.gz)
+# and, with the brotli package installed, a brotli copy (.br) next to it, for
+# servers that serve pre-compressed files (nginx gzip_static/brotli_static).
+import gzip
+import os
+import re
+import sys
+
+import plotly.offline
+
+import analytics
+import charts
+import components as ui
+import design_css
+import views
+from profile_stats import compute_profile_stats
+from snapshot import open_profile
+from thumbnails import thumbnail_cache
+from views import analytics as analytics_view
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_OUTPUT = os.path.join(ROOT, 'site')
+COMPRESSED_TYPES = ('.html', '.css', '.js', '.json')
+ACTIVE = ' class="active"'
+# Thumbnails as the views link them; the export copies them to thumbs/
+THUMBNAIL_SRC = re.compile(r'src="' + re.escape(thumbnail_cache.url_prefix) + r'/([0-9a-f]+)\.webp"')
+
+# Page layout in place of Streamlit's: a sticky sidebar next to the page
+# column. The sidebar keeps data-testid="stSidebar" so the design CSS styles it.
+LAYOUT_CSS = (
+    'body{margin:0;color:#fff}'
+    '.site{display:grid;grid-template-columns:280px minmax(0,1fr);min-height:100vh}'
+    '.site-sidebar{position:sticky;top:0;height:100vh;overflow-y:auto;padding:24px 18px;box-sizing:border-box}'
+    '.site-nav a{display:block;padding:14px 18px;margin-bottom:6px;border-radius:14px;'
+    'border:1px solid rgba(255,255,255,0.08);color:rgba(255,255,255,0.85);text-decoration:none;'
+    'font-weight:500;font-size:0.9rem}'
+    '.site-nav a:hover,.site-nav a.active{background:rgba(139,92,246,0.15);border-color:rgba(139,92,246,0.4)}'
+    '.site-main{padding:48px 5vw}'
+    '.site-columns{display:grid;gap:1.5rem}'
+    '.site-chart{min-height:300px}'
+    'hr{border:0;border-top:1px solid rgba(255,255,255,0.08);margin:24px 0}'
+    '@media (max-width:900px){.site{grid-template-columns:1fr}'
+    '.site-sidebar{position:static;height:auto}.site-columns{grid-template-columns:1fr!important}}'
+)
+
+_PAGE = ui.compile_template('''
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="utf-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1">
+        <title>{title}</title>
+        <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+        <link rel="stylesheet" href="{fonts_url}">
+        <link rel="stylesheet" href="assets/site.css?v={css_version}">
+    </head>
+    <body>
+        <div class="stApp site">
+            <section class="site-sidebar" data-testid="stSidebar">{sidebar}</section>
+            <main class="site-main">{body}</main>
+        </div>
+        {scripts}
+    </body>
+    </html>
+''')
+
+# Draws every [data-figure] placeholder from its JSON file
+_CHART_SCRIPT = (
+    '<script src="assets/plotly.min.js"></script>'
+    '<script>document.querySelectorAll("[data-figure]").forEach(function(el){'
+    'fetch(el.dataset.figure).then(function(r){return r.json()}).then(function(fig){'
+    'Plotly.newPlot(el,fig.data,fig.layout,{responsive:true,displaylogo:false})})})</script>'
+)
+
+
+def page_file(route):
+    return 'index.html' if route.slug == views.DEFAULT_ROUTE else f'{route.slug}.html'
+
+
+def fragments_html(fragments):
+    """The HTML of a view's fragments, laid out as app.emit_fragments lays them out in Streamlit."""
+    parts = []
+    for fragment in fragments:
+        if isinstance(fragment, ui.Columns):
+            columns = ' '.join(f'{weight}fr' for weight in fragment.spec)
+            parts.append(f'<div class="site-columns" style="grid-template-columns: {columns};">')
+            parts.extend(f'<div>{fragments_html(column)}</div>' for column in fragment.parts)
+            parts.append('</div>')
+        elif isinstance(fragment, ui.Paged):
+            parts.append(ui.paged_section(fragment, len(fragment.rows)))
+        elif fragment == '---':
+            parts.append('<hr>')
+        else:
+            parts.append(fragment)
+    return ''.join(parts)
+
+
+def analytics_page(profile, stats):
+    """The Analytics page as fragments, plus its figures as {name: figure JSON}.
+
+    Frames and figures are built here rather than taken from the app's
+    caches, which are keyed by a profile version the export does not have.
+    """
+    frames = analytics.build_frames(profile)
+    fragments = [ui.hero('Analytics Dashboard', 'Data-Driven Insights'), analytics_view.summary(stats)]
+    figures = {}
+    for row in analytics_view.chart_rows(frames, stats):
+        sections = []
+        for chart in row:
+            body = ''
+            if chart.build is not None:
+                figures[chart.name] = charts.figure_json(chart.build())
+                body = f'<div class="site-chart" data-figure="charts/{chart.name}.json"></div>'
+            sections.append([analytics_view.chart_header(chart) + body + '</div>'])
+        fragments.append(ui.Columns([1] * len(row), sections) if len(row) > 1 else sections[0][0])
+    return fragments, figures
+
+
+def sidebar_html(profile, stats, active):
+    nav = ''.join(
+        f'<a href="{page_file(route)}"{ACTIVE if route.slug == active else ""}>{route.icon} {ui.text(route.label)}</a>'
+        for route in views.ROUTES)
+    return (f'{ui.sidebar_header(profile)}<nav class="site-nav">{nav}</nav><hr>'
+            f'{ui.quick_stats(stats)}{ui.social_links(profile)}')
+
+
+def render_site(profile, stats, css):
+    """Every file of the export as {relative path: bytes}."""
+    files = {'assets/site.css': css.encode('utf-8')}
+    css_version = design_css.css_version(css)
+    name = profile.get('name', 'Alisher Beisembekov')
+    thumbs = set()
+    for route in views.ROUTES:
+        view = views.load(route)
+        scripts = ''
+        if hasattr(view, 'build'):
+            fragments = view.build(profile, stats)
+        else:
+            fragments, figures = analytics_page(profile, stats)
+            for chart, figure_json in figures.items():
+                files[f'charts/{chart}.json'] = figure_json.encode('utf-8')
+            if figures:
+                scripts = _CHART_SCRIPT
+        html = _PAGE(
+            title=ui.text(f'{route.label} | {name}'),
+            fonts_url=design_css.FONTS_URL.replace('&', '&amp;'),
+            css_version=css_version,
+            sidebar=sidebar_html(profile, stats, route.slug),
+            body=fragments_html(fragments) + ui.footer(profile),
+            scripts=scripts,
+        )
+        thumbs.update(THUMBNAIL_SRC.findall(html))
+        html = THUMBNAIL_SRC.sub(r'src="thumbs/\1.webp"', html)
+        files[page_file(route)] = html.encode('utf-8')
+    for digest in thumbs:
+        with open(thumbnail_cache.path(digest), 'rb') as f:
+            files[f'thumbs/{digest}.webp'] = f.read()
+    if any(path.startswith('charts/') for path in files):
+        files['assets/plotly.min.js'] = plotly.offline.get_plotlyjs().encode('utf-8')
+    return files
+
+
+def _gzip(data):
+    # mtime=0 keeps the output identical for identical input
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+# (suffix, compress) of the pre-compressed copies written next to each text file
+COMPRESSORS = [('.gz', _gzip)]
+if brotli is not None:
+    COMPRESSORS.append(('.br', lambda data: brotli.compress(data, quality=11)))
+
+
+def write_file(path, data):
+    """Write ``data`` if the file differs; returns whether it was written."""
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def export_site(profile_path, output_dir=DEFAULT_OUTPUT):
+    """Export every page of the profile at ``profile_path``; returns {relative path: size in bytes}.
+
+    Files whose content did not change are left alone, and so are their
+    compressed copies, which are only recompressed when the file changed.
+    """
+    profile = open_profile(profile_path)
+    stats = compute_profile_stats(profile)
+    css = design_css.read_css() + LAYOUT_CSS
+    sizes = {}
+    for path, data in render_site(profile, stats, css).items():
+        target = os.path.join(output_dir, path)
+        changed = write_file(target, data)
+        sizes[path] = len(data)
+        if not path.endswith(COMPRESSED_TYPES):
+            continue
+        for suffix, compress in COMPRESSORS:
+            if changed or not os.path.exists(target + suffix):
+                write_file(target + suffix, compress(data))
+            sizes[path + suffix] = os.path.getsize(target + suffix)
+    return sizes
+
+
+if __name__ == '__main__':
+    source_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(ROOT, 'profile.json')
+    target_dir = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_OUTPUT
+    written = export_site(source_path, target_dir)
+    for path in sorted(p for p in written if not p.endswith(('.gz', '.br'))):
+        copies = ', '.join(f"{ext} {written[path + ext]}" for ext in ('.gz', '.br') if path + ext in written)
+        print(f"{path}: {written[path]} bytes" + (f" ({copies})" if copies else ''))
+    if brotli is None:
+        print("brotli is not installed; only gzip copies were written")
@@ -0,0 +1,86 @@
+# Content-hash memoization for views derived from profile sections
+import hashlib
+import json
+import functools
+import threading
+from collections import OrderedDict
+
+
+def content_hash(value):
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def section_key(section):
+    """The digest a decoded section carries (profile_store.Section), else its content hash."""
+    digest = getattr(section, 'digest', None)
+    return digest if digest is not None else content_hash(section)
+
+
+class ContentMemo:
+    """Bounded LRU of derived views keyed by (view name, section content hash).
+
+    The memo is module-level, so it is shared by every session of the server
+    process: the first visitor pays for a view and everyone after gets it back
+    for a dict lookup. Sections decoded by LazyProfile carry the digest of
+    their bytes, hashed once at decode; anything else is hashed per lookup.
+    Values are shared by every session, so views return read-only structures.
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, name, section, compute):
+        key = (name, section_key(section))
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute(section)
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, name=None):
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == name]:
+                    del self._entries[key]
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+
+def memoized_view(memo, name):
+    """Decorator: ``fn(section)`` is memoized in ``memo`` under ``name``."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(section):
+            return memo.get_or_compute(name, section, fn)
+        wrapper.invalidate = lambda: memo.invalidate(name)
+        return wrapper
+    return decorator
+
+
+profile_memo = ContentMemo()
@@ -0,0 +1,77 @@
+# Memory accounting - tracemalloc snapshots around a block, summarized by source line
+#
+# Opt-in: tracing slows every allocation down, so the app only wraps its page
+# branch when MEMORY_PROFILE is set. tracemalloc is process-wide, so with
+# several sessions rerunning at once their allocations land in each other's
+# reports; profile with one active session.
+import linecache
+import threading
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+
+from env_flags import env_flag
+
+MEMORY_PROFILE = env_flag('MEMORY_PROFILE')
+
+# Allocations by tracemalloc itself and by the import machinery are noise here
+_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, linecache.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+    tracemalloc.Filter(False, '<unknown>'),
+]
+
+# One source line's share of a block: bytes and allocation count still held after it
+LineUsage = namedtuple('LineUsage', ['where', 'size', 'count'])
+# ``peak``: highest traced memory during the block over what was held before it;
+# ``retained``: what the block left allocated when it finished
+MemoryReport = namedtuple('MemoryReport', ['name', 'peak', 'retained', 'lines'])
+
+
+def line_usage(before, after, top=10):
+    """The ``top`` source lines by bytes allocated between two snapshots and still held."""
+    diff = after.filter_traces(_FILTERS).compare_to(before.filter_traces(_FILTERS), 'lineno')
+    lines = []
+    for stat in diff:
+        if stat.size_diff <= 0:
+            continue
+        frame = stat.traceback[0]
+        lines.append(LineUsage(f'{frame.filename}:{frame.lineno}', stat.size_diff, stat.count_diff))
+        if len(lines) == top:
+            break
+    return lines
+
+
+class MemoryProfiler:
+    """Most recent MemoryReport per block name."""
+
+    def __init__(self, top=10, frames=1):
+        self.top = top
+        self.frames = frames
+        self._reports = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def measure(self, name):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        before = tracemalloc.take_snapshot()
+        start, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            after = tracemalloc.take_snapshot()
+            report = MemoryReport(name, peak - start, current - start, line_usage(before, after, self.top))
+            with self._lock:
+                self._reports[name] = report
+
+    def reports(self):
+        with self._lock:
+            return dict(self._reports)
+
+
+memory_profiler = MemoryProfiler()
@@ -0,0 +1,149 @@
+# Multi-profile serving - crawled profiles from a directory, held in a byte-bounded LRU
+import os
+import re
+import sys
+import threading
+from collections import OrderedDict
+
+from profile_store import estimate_size
+from profile_watcher import LoadedProfile, file_digest
+
+_SLUG = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_.-]{0,127}$')
+
+
+class ByteBudgetLRU:
+    """LRU cache that evicts by the summed estimated size of its values, not their count.
+
+    The most recently inserted value is always kept, even if it alone is over budget.
+    """
+
+    def __init__(self, max_bytes, sizeof):
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        size = self._sizeof(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+            self._entries[key] = (value, size)
+            self.total_bytes += size
+            self._evict()
+
+    def resize(self, key):
+        """Measure the value under ``key`` again after it grew in place, evicting others to stay in budget."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return
+        size = self._sizeof(entry[0])
+        with self._lock:
+            current = self._entries.get(key)
+            if current is None or current[0] is not entry[0]:
+                return
+            self._entries[key] = (current[0], size)
+            self._entries.move_to_end(key)
+            self.total_bytes += size - current[1]
+            self._evict()
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted_size
+            self.evictions += 1
+
+    def discard(self, key):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= old[1]
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+            }
+
+
+def loaded_profile_size(loaded):
+    data = loaded.data
+    size = data.estimated_size() if hasattr(data, 'estimated_size') else estimate_size(data)
+    return size + sys.getsizeof(loaded.stats)
+
+
+class ProfileLibrary:
+    """Profiles in ``directory`` addressed by slug (``<slug>.json``).
+
+    ``build(path)`` returns ``(data, stats)`` as for the single-profile watcher.
+    A cached profile is rebuilt when its file's size or mtime changes. Lazily
+    loaded profiles are re-measured each time they decode another section, so
+    the byte budget covers what they hold now, not what they held when cached.
+    """
+
+    def __init__(self, directory, build, max_bytes=256 << 20):
+        self.directory = directory
+        self._build = build
+        # Entries are (stat key, LoadedProfile) so a changed file is noticed on lookup
+        self.cache = ByteBudgetLRU(max_bytes, lambda entry: loaded_profile_size(entry[1]))
+
+    def path_for(self, slug):
+        if not slug or not _SLUG.match(slug) or '..' in slug:
+            return None
+        path = os.path.join(self.directory, f'{slug}.json')
+        return path if os.path.isfile(path) else None
+
+    def slugs(self):
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return []
+        return sorted(name[:-5] for name in names if name.endswith('.json') and _SLUG.match(name[:-5]))
+
+    def get(self, slug):
+        """LoadedProfile for ``slug``, or None if there is no such profile."""
+        path = self.path_for(slug)
+        if path is None:
+            # A removed profile no longer counts against the budget
+            self.cache.discard(slug)
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            self.cache.discard(slug)
+            return None
+        stat_key = (st.st_size, st.st_mtime_ns)
+
+        entry = self.cache.get(slug)
+        if entry is not None and entry[0] == stat_key:
+            return entry[1]
+
+        data, stats = self._build(path)
+        loaded = LoadedProfile(data, stats, file_digest(path))
+        self.cache.put(slug, (stat_key, loaded))
+        if hasattr(data, 'on_decode'):
+            data.on_decode = lambda: self.cache.resize(slug)
+        return loaded
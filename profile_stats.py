@@ -0,0 +1,65 @@
+# Profile statistics - computed once per loaded profile and shared by every page
+import sys
+from dataclasses import dataclass
+
+import dates
+
+
+def certification_issuer(issuer):
+    """The issuer a certification counts under: "Coursera (DeepLearning.AI)" is Coursera."""
+    return (issuer or '').split('(')[0].strip()
+
+
+def tally_certification_issuers(certifications):
+    """(issuer, certifications) pairs, most first; ties keep first-seen order."""
+    issuers = {}
+    for cert in certifications:
+        issuer = certification_issuer(cert.get('issuer'))
+        if issuer:
+            issuer = sys.intern(issuer)
+            issuers[issuer] = issuers.get(issuer, 0) + 1
+    return tuple(sorted(issuers.items(), key=lambda x: x[1], reverse=True))
+
+
+@dataclass(frozen=True)
+class ProfileStats:
+    awards: int = 0
+    patents: int = 0
+    patents_kz: int = 0
+    publications: int = 0
+    certifications: int = 0
+    projects: int = 0
+    projects_documented: int = 0
+    projects_active: int = 0
+    positions: int = 0
+    career_positions: int = 0
+    career_current: int = 0
+    companies: int = 0
+    current_positions: int = 0
+    certification_issuers: tuple = ()
+
+
+def compute_profile_stats(profile):
+    experience = profile.get('experience') or []
+    projects = [p for p in profile.get('projects') or [] if p.get('name')]
+    patents = profile.get('patents') or []
+
+    # Career page counts roles that are not just a company header entry
+    career = [e for e in experience if e.get('title') and e.get('title') != e.get('company_name')]
+
+    return ProfileStats(
+        awards=len(profile.get('honors_and_awards') or []),
+        patents=len(patents),
+        patents_kz=sum(1 for p in patents if 'KZ' in (p.get('patent_id') or '')),
+        publications=len(profile.get('publications') or []),
+        certifications=len(profile.get('certifications') or []),
+        projects=len(projects),
+        projects_documented=sum(1 for p in projects if p.get('description')),
+        projects_active=sum(1 for p in projects if p.get('date') and dates.end(p) in (dates.NO_DATE, dates.PRESENT)),
+        positions=sum(1 for e in experience if e.get('title')),
+        career_positions=len(career),
+        career_current=sum(1 for e in career if dates.is_current(e)),
+        companies=len(set(e.get('company_name', '') for e in career)),
+        current_positions=sum(1 for e in experience if e.get('title') and dates.is_current(e)),
+        certification_issuers=tally_certification_issuers(profile.get('certifications') or []),
+    )
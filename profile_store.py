@@ -0,0 +1,290 @@
+# Profile storage - lazy, section-on-demand access to profile.json
+import hashlib
+import json
+import re
+import sys
+import threading
+from collections.abc import Mapping
+
+import dates
+from textutils import clean_html
+
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_KEY = re.compile(rb'\s*(' + _STRING + rb')\s*:\s*')
+_SCALAR = re.compile(_STRING + rb'|[^,}\s]+')
+_SEPARATOR = re.compile(rb'\s*([,}])')
+# Everything up to the next bracket that is not inside a string
+_SKIP = re.compile(rb'(?:[^"\[\]{}]+|' + _STRING + rb')*')
+_OPEN = b'[{'
+_SPACE = (b' ', b'\t', b'\r', b'\n')
+_INDENTED_LAYOUT = re.compile(rb'\s*\{\r?\n([ \t]+)"')
+_CLOSE = b']}'
+
+
+def _skip_container(raw, pos):
+    # raw[pos] opens an array or object; return the offset just past its close
+    depth = 0
+    while True:
+        ch = raw[pos]
+        if ch in _OPEN:
+            depth += 1
+        elif ch in _CLOSE:
+            depth -= 1
+            if depth == 0:
+                return pos + 1
+        else:
+            raise ValueError("unterminated string in profile JSON")
+        pos = _SKIP.match(raw, pos + 1).end()
+
+
+def index_sections(raw):
+    """Map each top-level key of a JSON object to the (start, end) byte span of its value.
+
+    Only the top level is tokenized in Python; nested containers are skipped
+    bracket to bracket with a regex that consumes strings and text in C.
+    """
+    pos = raw.find(b'{')
+    if pos < 0:
+        raise ValueError("profile is not a JSON object")
+    pos += 1
+
+    index = {}
+    empty = _SEPARATOR.match(raw, pos)
+    if empty and empty.group(1) == b'}':
+        return index
+    try:
+        while True:
+            key_match = _KEY.match(raw, pos)
+            if key_match is None:
+                raise ValueError(f"expected a key at byte {pos} of profile JSON")
+            start = key_match.end()
+            if raw[start] in _OPEN:
+                end = _skip_container(raw, start)
+            else:
+                end = _SCALAR.match(raw, start).end()
+            index[json.loads(key_match.group(1))] = (start, end)
+
+            separator = _SEPARATOR.match(raw, end)
+            if separator is None:
+                raise ValueError(f"expected ',' or '}}' at byte {end} of profile JSON")
+            if separator.group(1) == b'}':
+                return index
+            pos = separator.end()
+    except IndexError:
+        raise ValueError("profile JSON is truncated") from None
+
+
+def index_indented_sections(raw):
+    """Fast path for pretty-printed profiles (``json.dump(..., indent=n)``).
+
+    In that layout a newline followed by exactly the first key's indentation
+    and a quote can only start a top-level key, so one literal-prefix regex
+    scan finds every section. Returns None when the layout does not match.
+    """
+    layout = _INDENTED_LAYOUT.match(raw)
+    if layout is None or not raw.rstrip().endswith(b'}'):
+        return None
+    key_line = re.compile(rb'\n' + layout.group(1) + rb'(' + _STRING + rb')[ \t]*:[ \t]*')
+    matches = list(key_line.finditer(raw, layout.start(1) - 1))
+
+    index = {}
+    last = len(matches) - 1
+    for i, match in enumerate(matches):
+        end = _rskip_space(raw, matches[i + 1].start() if i < last else raw.rindex(b'}'))
+        if i < last:
+            if raw[end - 1:end] != b',':
+                return None
+            end = _rskip_space(raw, end - 1)
+        index[json.loads(match.group(1))] = (match.end(), end)
+    return index
+
+
+def _rskip_space(raw, end):
+    while raw[end - 1:end] in _SPACE:
+        end -= 1
+    return end
+
+
+# Item fields whose values repeat across entries and across profiles
+# ("Google Cloud", "HackerRank", "Present", "Aug 2025", ...); decoded
+# sections share one copy of each through sys.intern.
+INTERNED_FIELDS = frozenset([
+    'issuer', 'company_name', 'publisher', 'university_name', 'degree',
+    'location', 'subtitle', 'start_date', 'end_date', 'issued_date',
+])
+
+
+def intern_strings(section):
+    if not isinstance(section, list):
+        return section
+    for item in section:
+        if not isinstance(item, dict):
+            continue
+        for field, value in item.items():
+            if field in INTERNED_FIELDS and type(value) is str:
+                item[field] = sys.intern(value)
+        date = item.get('date')
+        if isinstance(date, dict):
+            for field, value in date.items():
+                if type(value) is str:
+                    date[field] = sys.intern(value)
+    return section
+
+
+# HTML fields that pages only ever show cleaned; decoded items carry the
+# cleaned text under "<field>_text" next to the HTML, so textutils.item_text
+# does not clean it per render. Text without markup is one shared string.
+CLEANED_FIELDS = {
+    'experience': ('description',),
+    'projects': ('description',),
+}
+
+
+def add_cleaned_text(name, section):
+    fields = CLEANED_FIELDS.get(name)
+    if not fields or not isinstance(section, list):
+        return section
+    for item in section:
+        if not isinstance(item, dict):
+            continue
+        for field in fields:
+            value = item.get(field)
+            if type(value) is str:
+                text = clean_html(value)
+                item[f'{field}_text'] = value if text == value else text
+    return section
+
+
+def prepare_section(name, section):
+    """Everything done to a section after decoding: cleaned text, interned strings, parsed dates."""
+    return dates.annotate(intern_strings(add_cleaned_text(name, section)))
+
+
+class Section(list):
+    """A decoded list section, carrying ``digest``: the hash of the bytes it was decoded from.
+
+    Views memoized by section content (memo.py) key on the digest instead of
+    re-hashing the decoded items on every lookup.
+    """
+    __slots__ = ('digest',)
+
+    def __init__(self, items, digest):
+        super().__init__(items)
+        self.digest = digest
+
+
+def estimate_size(value, _seen=None):
+    """Approximate resident bytes of a decoded JSON value; shared objects count once."""
+    seen = _seen if _seen is not None else set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += estimate_size(key, seen) + estimate_size(item, seen)
+    elif isinstance(value, list):
+        for item in value:
+            size += estimate_size(item, seen)
+    return size
+
+
+class LazyProfile(Mapping):
+    """Read-only mapping over a profile JSON document.
+
+    The top-level sections are indexed once; each section is only decoded the
+    first time it is looked up, then kept for later lookups. Decoding also
+    prepares the section (prepare_section: cleaned text of HTML fields,
+    interned strings, parsed dates); list sections come back as a Section
+    carrying the digest of their bytes.
+
+    With ``loads`` (see snapshot.py), sections are not JSON: ``loads`` turns
+    a section's bytes straight into its final, already prepared value.
+
+    ``on_decode``, if set, is called after each section is decoded, e.g. to
+    re-account the profile's size. Once every section is decoded the raw
+    bytes are released.
+    """
+
+    def __init__(self, raw, index=None, loads=None):
+        # An index supplied by the caller (e.g. a snapshot's offset table) is exact
+        self._exact = index is not None
+        if index is None:
+            index = index_indented_sections(raw)
+        if index is None:
+            index = index_sections(raw)
+            self._exact = True
+        self._raw = raw
+        self._index = index
+        self._loads = loads
+        self._parsed = {}
+        # Estimated size of each decoded section, measured when first asked for
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self.on_decode = None
+
+    @classmethod
+    def from_file(cls, path):
+        with open(path, 'rb') as f:
+            return cls(f.read())
+
+    def __getitem__(self, key):
+        try:
+            return self._parsed[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key in self._parsed:
+                return self._parsed[key]
+            payload, section = self._decode(key)
+            if self._loads is None:
+                section = prepare_section(key, section)
+            if isinstance(section, list):
+                section = Section(section, hashlib.blake2b(payload, digest_size=16).hexdigest())
+            self._parsed[key] = section
+            if len(self._parsed) == len(self._index):
+                self._raw = None
+        if self.on_decode is not None:
+            self.on_decode()
+        return section
+
+    def _decode(self, key):
+        # (the section's bytes, their decoded value)
+        start, end = self._index[key]
+        payload = self._raw[start:end]
+        if self._loads is not None:
+            return payload, self._loads(payload)
+        try:
+            return payload, json.loads(payload)
+        except json.JSONDecodeError:
+            if self._exact:
+                raise
+        # The layout heuristic was fooled by unusual formatting; re-index exactly
+        self._index = index_sections(self._raw)
+        self._exact = True
+        self._parsed.clear()
+        self._sizes.clear()
+        start, end = self._index[key]
+        payload = self._raw[start:end]
+        return payload, json.loads(payload)
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def loaded_sections(self):
+        return list(self._parsed)
+
+    def estimated_size(self):
+        """Raw bytes still held plus the decoded sections; each section is measured once."""
+        with self._lock:
+            parsed = [(key, value) for key, value in self._parsed.items() if key not in self._sizes]
+            raw_size = len(self._raw) if self._raw is not None else 0
+        for key, value in parsed:
+            self._sizes.setdefault(key, estimate_size(value))
+        return raw_size + sum(self._sizes.values())
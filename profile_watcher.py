@@ -0,0 +1,121 @@
+# Profile hot-swapping - reload profile.json in the background when the crawl changes it
+import hashlib
+import logging
+import os
+import threading
+from collections import namedtuple
+
+from awards import categorize_awards
+from profile_stats import compute_profile_stats
+from snapshot import open_profile
+
+logger = logging.getLogger(__name__)
+
+# Everything the pages need from one version of the profile, swapped as a unit
+LoadedProfile = namedtuple('LoadedProfile', ['data', 'stats', 'version'])
+
+
+def build_profile(profile_path):
+    """``(data, stats)`` for one version of the profile at ``profile_path``, with the derived views warmed.
+
+    A fresh snapshot (built by snapshot.py) is memory-mapped; otherwise the
+    JSON file is read. Sections are decoded lazily, the first time something
+    asks for them. Used by the app and the API as the ``build`` of their
+    watchers and profile libraries.
+    """
+    data = open_profile(profile_path)
+    stats = compute_profile_stats(data)
+    categorize_awards(data.get('honors_and_awards', []))
+    return data, stats
+
+
+def file_digest(path):
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class ProfileWatcher:
+    """Polls a profile file and swaps in a freshly built LoadedProfile when it changes.
+
+    ``build(path)`` returns ``(data, stats)`` and runs on the watcher thread, so
+    parsing and index building never happen on a request. Readers call
+    ``current()``, which is a single attribute read: they see either the old
+    profile or the new one, never a mix.
+    """
+
+    def __init__(self, path, build, interval=2.0):
+        self.path = path
+        self.interval = interval
+        self._build = build
+        self._stop = threading.Event()
+        self._thread = None
+        self._stat = _stat_key(path)
+        self._pending = None
+        self._current = self._load()
+        self.reloads = 0
+
+    def _load(self):
+        version = file_digest(self.path)
+        data, stats = self._build(self.path)
+        return LoadedProfile(data, stats, version)
+
+    def current(self):
+        return self._current
+
+    def check(self):
+        """Reload if the file changed and has stopped changing; returns True on a swap."""
+        stat = _stat_key(self.path)
+        if stat is None or stat == self._stat:
+            self._pending = None
+            return False
+        # Wait until the writer is done: the same new stat must be seen twice
+        if stat != self._pending:
+            self._pending = stat
+            return False
+        self._pending = None
+        self._stat = stat
+        if file_digest(self.path) == self._current.version:
+            return False
+        try:
+            loaded = self._load()
+            # Off the request path: decode every section before the swap, so
+            # pages never parse and a section that fails to decode is rejected
+            for key in loaded.data:
+                loaded.data[key]
+        except (OSError, ValueError) as exc:
+            logger.warning("Keeping the current profile; reloading %s failed: %s", self.path, exc)
+            return False
+        self._current = loaded
+        self.reloads += 1
+        logger.info("Reloaded profile %s (version %s)", self.path, loaded.version)
+        return True
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception("Profile watcher check failed")
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='profile-watcher', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
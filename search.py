@@ -0,0 +1,129 @@
+# Profile search - an inverted index over the profile's text, ranked with BM25
+#
+# The index is built once per profile version (see profile_index) from the
+# clean_html-normalized text of every searchable entry. A query only touches
+# the posting lists of its terms, never the profile itself.
+import heapq
+import math
+import re
+from bisect import bisect_left
+from collections import namedtuple
+
+from versioned_cache import VersionedCache
+from textutils import clean_html
+from timings import timings
+
+_TOKEN = re.compile(r'\w+')
+
+# A searchable entry: the page that shows it, a short kind label, and the text shown in results
+SearchDoc = namedtuple('SearchDoc', ['page', 'kind', 'title', 'subtitle'])
+SearchHit = namedtuple('SearchHit', ['score', 'doc'])
+
+# section -> (page, kind, title field, subtitle field, further text fields)
+SEARCH_SECTIONS = {
+    'honors_and_awards': ('achievements', 'Award', 'title', 'issuer', ()),
+    'certifications': ('research', 'Certification', 'title', 'issuer', ()),
+    'publications': ('research', 'Publication', 'title', 'publisher', ('description',)),
+    'projects': ('projects', 'Project', 'name', None, ('description',)),
+    'experience': ('career', 'Experience', 'title', 'company_name', ('location', 'description')),
+    'patents': ('patents', 'Patent', 'title', 'patent_id', ()),
+}
+
+index_cache = VersionedCache(maxsize=16)
+
+
+def tokenize(text):
+    return _TOKEN.findall(text.lower())
+
+
+def profile_documents(profile):
+    """(SearchDoc, searchable text) for every entry of the searchable sections."""
+    for section, (page, kind, title_field, subtitle_field, text_fields) in SEARCH_SECTIONS.items():
+        for item in profile.get(section) or []:
+            if not isinstance(item, dict):
+                continue
+            title = clean_html(item.get(title_field))
+            if not title:
+                continue
+            subtitle = clean_html(item.get(subtitle_field)) if subtitle_field else ''
+            text = ' '.join([title, subtitle, *(clean_html(item.get(field)) for field in text_fields)])
+            yield SearchDoc(page, kind, title, subtitle), text
+
+
+class SearchIndex:
+    """BM25 over an inverted index of term -> (doc ids, term frequencies).
+
+    The last query term also matches as a prefix, so results show up while a
+    word is still being typed.
+    """
+
+    def __init__(self, documents, k1=1.2, b=0.75):
+        self.docs = []
+        postings = {}
+        lengths = []
+        for doc, text in documents:
+            doc_id = len(self.docs)
+            self.docs.append(doc)
+            tokens = tokenize(text)
+            lengths.append(len(tokens))
+            counts = {}
+            for token in tokens:
+                counts[token] = counts.get(token, 0) + 1
+            for token, tf in counts.items():
+                posting = postings.get(token)
+                if posting is None:
+                    posting = postings[token] = ([], [])
+                posting[0].append(doc_id)
+                posting[1].append(tf)
+
+        n = len(self.docs)
+        avgdl = sum(lengths) / n if n else 0.0
+        # Length normalization of each document, folded into one constant per doc
+        self._norm = [k1 * (1 - b + b * length / avgdl) if avgdl else k1 for length in lengths]
+        self._k1 = k1
+        self._postings = {term: (ids, tfs, math.log(1 + (n - len(ids) + 0.5) / (len(ids) + 0.5)))
+                          for term, (ids, tfs) in postings.items()}
+        self._terms = sorted(self._postings)
+
+    def __len__(self):
+        return len(self.docs)
+
+    def _expand(self, prefix, limit=32):
+        start = bisect_left(self._terms, prefix)
+        terms = []
+        for term in self._terms[start:start + limit]:
+            if not term.startswith(prefix):
+                break
+            terms.append(term)
+        return terms
+
+    def search(self, query, k=10):
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        # Each query term is a group of index terms: itself, or its completions for the last one
+        groups = [[t] if t in self._postings else [] for t in tokens[:-1]]
+        groups.append(self._expand(tokens[-1]))
+
+        k1 = self._k1
+        norm = self._norm
+        scores = {}
+        for terms in groups:
+            for term in terms:
+                ids, tfs, idf = self._postings[term]
+                weight = idf * (k1 + 1)
+                for doc_id, tf in zip(ids, tfs):
+                    scores[doc_id] = scores.get(doc_id, 0.0) + weight * tf / (tf + norm[doc_id])
+        best = heapq.nlargest(k, scores.items(), key=lambda item: (item[1], -item[0]))
+        return [SearchHit(score, self.docs[doc_id]) for doc_id, score in best]
+
+
+def build_index(profile):
+    return SearchIndex(profile_documents(profile))
+
+
+def profile_index(profile, version, profile_key='default'):
+    def timed_build():
+        with timings.measure('search.index.build'):
+            return build_index(profile)
+    return index_cache.get_or_build('search', version, timed_build, profile=profile_key)
@@ -0,0 +1,120 @@
+# Binary profile snapshot - a pre-decoded, memory-mapped copy of profile.json
+#
+#   python snapshot.py [profile.json] [profile.snap]
+#
+# Layout (little-endian):
+#   magic            8 bytes   b'PRSNAP04'
+#   python           2 x u8    major, minor version of the Python that wrote it
+#   source_size      u64       size of the profile.json it was built from
+#   source_mtime_ns  i64       mtime of that file, used to detect stale snapshots
+#   section_count    u32
+#   offset table     section_count x (name_len u16, offset u64, length u64, name)
+#   payloads         one marshal payload per top-level section
+#
+# Each section is stored as LazyProfile would hold it after decoding JSON
+# (profile_store.prepare_section), so a profile reads the same with or
+# without a snapshot. Opening a section
+# is one marshal.loads of its slice of the map, with no JSON parsing and no
+# post-processing. The marshal format belongs to the Python version, so a
+# snapshot written by another version counts as stale.
+import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+
+from profile_store import LazyProfile, prepare_section
+
+MAGIC = b'PRSNAP04'
+_HEADER = struct.Struct('<8sBBQqI')
+_ENTRY = struct.Struct('<HQQ')
+
+
+def default_snapshot_path(profile_path):
+    return os.path.splitext(profile_path)[0] + '.snap'
+
+
+def _payload(name, section):
+    return marshal.dumps(prepare_section(name, section))
+
+
+def build_snapshot(profile_path, snapshot_path=None):
+    snapshot_path = snapshot_path or default_snapshot_path(profile_path)
+    source = os.stat(profile_path)
+    with open(profile_path, 'r', encoding='utf-8') as f:
+        profile = json.load(f)
+
+    names = [name.encode('utf-8') for name in profile]
+    payloads = [_payload(name, value) for name, value in profile.items()]
+
+    table_size = sum(_ENTRY.size + len(name) for name in names)
+    offset = _HEADER.size + table_size
+    table = []
+    for name, payload in zip(names, payloads):
+        table.append(_ENTRY.pack(len(name), offset, len(payload)) + name)
+        offset += len(payload)
+
+    # Write next to the target and rename, so readers never map a partial file
+    tmp_path = snapshot_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, *sys.version_info[:2], source.st_size, source.st_mtime_ns, len(names)))
+        f.writelines(table)
+        f.writelines(payloads)
+    os.replace(tmp_path, snapshot_path)
+    return snapshot_path
+
+
+def open_snapshot(snapshot_path, profile_path=None):
+    """Map a snapshot read-only. Returns None if it is missing, invalid or stale."""
+    try:
+        with open(snapshot_path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(mapped) < _HEADER.size:
+        mapped.close()
+        return None
+    magic, major, minor, source_size, source_mtime_ns, count = _HEADER.unpack_from(mapped, 0)
+    if magic != MAGIC or (major, minor) != sys.version_info[:2]:
+        mapped.close()
+        return None
+    if profile_path is not None:
+        try:
+            source = os.stat(profile_path)
+        except OSError:
+            source = None
+        if source is not None and (source.st_size, source.st_mtime_ns) != (source_size, source_mtime_ns):
+            mapped.close()
+            return None
+
+    index = {}
+    pos = _HEADER.size
+    try:
+        for _ in range(count):
+            name_len, offset, length = _ENTRY.unpack_from(mapped, pos)
+            pos += _ENTRY.size
+            name = mapped[pos:pos + name_len].decode('utf-8')
+            pos += name_len
+            if offset + length > len(mapped):
+                raise ValueError(f"section {name!r} runs past the end of the snapshot")
+            index[name] = (offset, offset + length)
+    except (struct.error, ValueError):
+        mapped.close()
+        return None
+    return LazyProfile(mapped, index=index, loads=marshal.loads)
+
+
+def open_profile(profile_path, snapshot_path=None):
+    """Open the snapshot for ``profile_path`` if it is fresh, else the JSON file itself."""
+    snapshot = open_snapshot(snapshot_path or default_snapshot_path(profile_path), profile_path)
+    if snapshot is not None:
+        return snapshot
+    return LazyProfile.from_file(profile_path)
+
+
+if __name__ == '__main__':
+    source_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(__file__), 'profile.json')
+    target_path = sys.argv[2] if len(sys.argv) > 2 else None
+    print(build_snapshot(source_path, target_path))
@@ -0,0 +1,57 @@
+# Text helpers shared by the app and the offline build steps
+import functools
+import re
+
+# One alternation per pass: a tag or a whitespace run becomes a single space,
+# an emoji (optionally) becomes nothing
+_TAG_OR_SPACE = re.compile(r'(<[^<]+?>|\s+)')
+_TAG_OR_SPACE_OR_EMOJI = re.compile(
+    r'(<[^<]+?>|\s+)|[☀-➿⬀-⯿️‍\U0001f000-\U0001faff]+')
+
+
+@functools.lru_cache(maxsize=4096)
+def clean_html(text, limit=None, strip_emoji=False):
+    """Visible text of an HTML fragment: tags stripped, whitespace collapsed, ends trimmed.
+
+    With ``limit``, the result is the first ``limit`` characters of the full
+    cleaned text, and scanning stops as soon as they have been produced.
+    Memoized per (text, limit, strip_emoji).
+    """
+    if not text:
+        return ""
+    pattern = _TAG_OR_SPACE_OR_EMOJI if strip_emoji else _TAG_OR_SPACE
+    parts = []
+    size = 0
+    space = False
+    pos = 0
+    for match in pattern.finditer(text):
+        start = match.start()
+        if start > pos:
+            if space and size:
+                parts.append(' ')
+                size += 1
+            parts.append(text[pos:start])
+            size += start - pos
+            space = False
+            if limit is not None and size >= limit:
+                return ''.join(parts)[:limit]
+        pos = match.end()
+        if match.group(1) is not None:
+            space = True
+    if pos < len(text):
+        if space and size:
+            parts.append(' ')
+        parts.append(text[pos:])
+    return ''.join(parts)[:limit]
+
+
+def item_text(item, field, limit=None, strip_emoji=False):
+    """Cleaned text of an HTML field, at most ``limit`` characters.
+
+    Decoded profile sections carry it precomputed under ``<field>_text``
+    (profile_store.CLEANED_FIELDS).
+    """
+    text = item.get(f'{field}_text')
+    if text is not None and not strip_emoji:
+        return text[:limit]
+    return clean_html(text if text is not None else item.get(field, ''), limit, strip_emoji)
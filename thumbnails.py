@@ -0,0 +1,254 @@
+# Thumbnail cache - crawled activity and company images, fetched once and served locally
+#
+#   python thumbnails.py [profile.json]      prefetch every image the profile links to
+#
+# Crawled image URLs point at the LinkedIn CDN, are signed and expire, so the
+# pages never hotlink them. Missing images are fetched concurrently (asyncio,
+# each blocking GET of a pooled requests.Session in a worker thread), downsized
+# with Pillow and stored as static/thumbs/<digest>.webp. The file is named by
+# the digest of the source image, so a picture behind several URLs (the
+# default company logo, say) is stored once; index.json maps URLs to digests.
+# Streamlit serves static/ at app/static (server.enableStaticServing).
+#
+# Fetching is best effort: an unreachable host, an error status or an
+# undecodable image is logged and skipped, and the page renders without that
+# image. A failed URL is tried again after RETRY_AFTER seconds, so an offline
+# server does not retry on every rerun. THUMBNAIL_PREFETCH=0 stops the app
+# from fetching at all (headless runs, benchmarks); pages then show whatever
+# is already cached.
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+from env_flags import env_flag
+
+logger = logging.getLogger(__name__)
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+THUMBNAIL_DIR = os.environ.get('THUMBNAIL_DIR', os.path.join(ROOT, 'static', 'thumbs'))
+THUMBNAIL_URL = 'app/static/thumbs'
+THUMBNAIL_SIZE = (160, 160)
+# Larger downloads are abandoned; the sources are at most a few MB
+MAX_IMAGE_BYTES = 16 << 20
+RETRY_AFTER = 600.0
+THUMBNAIL_PREFETCH = env_flag('THUMBNAIL_PREFETCH', default=True)
+_INDEX = 'index.json'
+
+
+def profile_image_urls(profile):
+    """The image URLs of the sections that show thumbnails, in page order, without repeats."""
+    urls = {}
+    for section in ('activities', 'experience'):
+        for item in profile.get(section) or []:
+            url = item.get('image_url') if isinstance(item, dict) else None
+            if url and url.startswith(('http://', 'https://')):
+                urls[url] = None
+    return list(urls)
+
+
+def make_thumbnail(data, size=THUMBNAIL_SIZE):
+    """WebP bytes of the image in ``data``, scaled down to fit ``size``."""
+    from PIL import Image, ImageOps
+
+    with Image.open(io.BytesIO(data)) as image:
+        # JPEG sources decode straight at a reduced scale
+        image.draft('RGB', (size[0] * 2, size[1] * 2))
+        image = ImageOps.exif_transpose(image)
+        image.thumbnail(size)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB')
+        out = io.BytesIO()
+        image.save(out, 'WEBP', quality=80, method=4)
+    return out.getvalue()
+
+
+class ThumbnailCache:
+    """Content-addressed thumbnails in ``directory``, looked up by source URL.
+
+    ``url()`` is a dict lookup, cheap enough for page builds; ``prefetch()``
+    does the network and image work. ``hits`` and ``misses`` count lookups,
+    ``fetched`` and ``failed`` the outcomes of prefetches, for diagnostics.
+    """
+
+    def __init__(self, directory=THUMBNAIL_DIR, url_prefix=THUMBNAIL_URL, size=THUMBNAIL_SIZE,
+                 concurrency=8, timeout=5.0, retry_after=RETRY_AFTER):
+        self.directory = directory
+        self.url_prefix = url_prefix
+        self.size = size
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.hits = 0
+        self.misses = 0
+        self.fetched = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+        # URLs being fetched right now, and when each failing URL last failed
+        self._pending = set()
+        self._failed_at = {}
+
+    def _load_index(self):
+        try:
+            with open(os.path.join(self.directory, _INDEX), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Entries whose file was removed are fetched again
+        return {url: digest for url, digest in index.items() if os.path.isfile(self.path(digest))}
+
+    def _save_index(self):
+        path = os.path.join(self.directory, _INDEX)
+        with self._lock:
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(self._index, f, sort_keys=True)
+            os.replace(path + '.tmp', path)
+
+    def path(self, digest):
+        return os.path.join(self.directory, f'{digest}.webp')
+
+    def digest(self, image_url):
+        return self._index.get(image_url) if image_url else None
+
+    def url(self, image_url):
+        """Where the page loads the thumbnail of ``image_url`` from, or None if it is not cached."""
+        digest = self.digest(image_url)
+        if digest is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return f'{self.url_prefix}/{digest}.webp'
+
+    def missing(self, urls):
+        """The URLs worth fetching: not cached, not in flight and not failed within ``retry_after``."""
+        with self._lock:
+            return self._missing(urls)
+
+    def _missing(self, urls):
+        retry_before = time.monotonic() - self.retry_after
+        return [url for url in dict.fromkeys(urls)
+                if url and url not in self._index and url not in self._pending
+                and self._failed_at.get(url, retry_before) <= retry_before]
+
+    def _claim(self, urls):
+        # Missing URLs, marked in flight in the same step so concurrent prefetches split the work
+        with self._lock:
+            claimed = self._missing(urls)
+            self._pending.update(claimed)
+            return claimed
+
+    def _store(self, data):
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        path = self.path(digest)
+        if not os.path.isfile(path):
+            thumbnail = make_thumbnail(data, self.size)
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f'{path}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(thumbnail)
+            os.replace(tmp_path, path)
+        return digest
+
+    def _fetch(self, session, url):
+        with session.get(url, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            data = response.raw.read(MAX_IMAGE_BYTES + 1, decode_content=True)
+        if len(data) > MAX_IMAGE_BYTES:
+            raise ValueError(f"image larger than {MAX_IMAGE_BYTES} bytes")
+        return self._store(data)
+
+    async def _fetch_one(self, session, semaphore, url):
+        async with semaphore:
+            try:
+                digest = await asyncio.to_thread(self._fetch, session, url)
+            except Exception as exc:
+                # requests errors, OSError (including Pillow's UnidentifiedImageError), ValueError
+                with self._lock:
+                    self._failed_at[url] = time.monotonic()
+                self.failed += 1
+                logger.info("No thumbnail for %s: %s", url, exc)
+                return None
+            self.fetched += 1
+            return digest
+
+    async def prefetch(self, urls):
+        """Fetch and store the thumbnails of ``urls`` that are not cached yet; returns how many were stored."""
+        return await self._prefetch_claimed(self._claim(urls))
+
+    async def _prefetch_claimed(self, urls):
+        if not urls:
+            return 0
+        try:
+            # Imported here: only prefetching needs them, page builds only read the index
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            semaphore = asyncio.Semaphore(self.concurrency)
+            with requests.Session() as session:
+                adapter = HTTPAdapter(pool_connections=self.concurrency, pool_maxsize=self.concurrency)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                digests = await asyncio.gather(*(self._fetch_one(session, semaphore, url) for url in urls))
+
+            stored = {url: digest for url, digest in zip(urls, digests) if digest}
+            if stored:
+                with self._lock:
+                    self._index = {**self._index, **stored}
+                self._save_index()
+            return len(stored)
+        finally:
+            with self._lock:
+                self._pending.difference_update(urls)
+
+    def prefetch_in_background(self, urls, on_stored=None):
+        """Run ``prefetch(urls)`` on a daemon thread; ``on_stored(count)`` is called there if any were stored.
+
+        Returns the thread, or None if there was nothing to fetch.
+        """
+        urls = self._claim(urls)
+        if not urls:
+            return None
+
+        def run():
+            try:
+                stored = asyncio.run(self._prefetch_claimed(urls))
+            except Exception:
+                logger.exception("Thumbnail prefetch failed")
+                return
+            if stored and on_stored is not None:
+                on_stored(stored)
+
+        thread = threading.Thread(target=run, name='thumbnail-prefetch', daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'size': len(self._index),
+            'fetched': self.fetched,
+            'failed': self.failed,
+        }
+
+
+thumbnail_cache = ThumbnailCache()
+
+
+if __name__ == '__main__':
+    from snapshot import open_profile
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    source_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(ROOT, 'profile.json')
+    urls = profile_image_urls(open_profile(source_path))
+    stored = asyncio.run(thumbnail_cache.prefetch(urls))
+    print(f"{stored} new thumbnails, {len(thumbnail_cache.missing(urls))} of {len(urls)} images unavailable, "
+          f"cache at {thumbnail_cache.directory}")
@@ -0,0 +1,48 @@
+# Timing instrumentation - wall-clock cost of named steps, aggregated per server process
+import threading
+import time
+from contextlib import contextmanager
+
+
+class Timings:
+    """Count, total, last and worst duration of each named step."""
+
+    def __init__(self):
+        self._steps = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self._lock:
+            step = self._steps.get(name)
+            if step is None:
+                step = self._steps[name] = {'count': 0, 'total': 0.0, 'last': 0.0, 'max': 0.0}
+            step['count'] += 1
+            step['total'] += seconds
+            step['last'] = seconds
+            step['max'] = max(step['max'], seconds)
+
+    @contextmanager
+    def measure(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def reset(self):
+        with self._lock:
+            self._steps.clear()
+
+    def stats(self):
+        """Per step: count and total/mean/last/max milliseconds."""
+        with self._lock:
+            return {name: {
+                'count': s['count'],
+                'total_ms': s['total'] * 1e3,
+                'mean_ms': s['total'] * 1e3 / s['count'],
+                'last_ms': s['last'] * 1e3,
+                'max_ms': s['max'] * 1e3,
+            } for name, s in self._steps.items()}
+
+
+timings = Timings()
@@ -0,0 +1,77 @@
+# Versioned cache - values built once per (profile, name) and profile version
+import threading
+from collections import OrderedDict
+
+
+class VersionedCache:
+    """Values derived from one version of a profile, shared by every session.
+
+    One entry is kept per (profile, name), tagged with the profile version it
+    was built from. A lookup with a different version is a miss and replaces
+    the entry, so a hot-swapped profile invalidates what was built from it
+    without any bookkeeping by the caller. ``maxsize`` bounds the number of
+    entries across names and profiles.
+    """
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {}
+
+    def _count(self, name, outcome):
+        counters = self._counters.setdefault(name, {'hits': 0, 'misses': 0})
+        counters[outcome] += 1
+
+    def get(self, name, version, profile='default'):
+        """The cached value for this version, or None.
+
+        Only hits are counted; a miss is expected to be followed by
+        ``get_or_build``, which counts it.
+        """
+        key = (profile, name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                return None
+            self._entries.move_to_end(key)
+            self._count(name, 'hits')
+            return entry[1]
+
+    def get_or_build(self, name, version, build, profile='default'):
+        key = (profile, name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self._count(name, 'hits')
+                return entry[1]
+            self._count(name, 'misses')
+
+        value = build()
+
+        with self._lock:
+            self._entries[key] = (version, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, name=None):
+        with self._lock:
+            for key in [k for k in self._entries if name is None or k[1] == name]:
+                del self._entries[key]
+
+    def stats(self):
+        """Hit counts in total and, under ``by_name``, per name."""
+        with self._lock:
+            hits = sum(c['hits'] for c in self._counters.values())
+            misses = sum(c['misses'] for c in self._counters.values())
+            return {
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': hits / (hits + misses) if hits + misses else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'by_name': {name: dict(c) for name, c in self._counters.items()},
+            }
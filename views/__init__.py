@@ -0,0 +1,43 @@
+# Page registry - one module per route, imported the first time its page is shown
+#
+# A route is addressed as ?page=<slug>. A view module defines either
+#   build(profile_data, profile_stats) -> fragments   pure HTML; app.py caches it per profile version
+#   render(page: PageContext)                         emits Streamlit elements itself
+# Only the active page's module (and whatever it imports, e.g. plotly and
+# pandas for Analytics) is loaded; the rest stay unimported.
+#
+# Not called pages/: Streamlit treats a pages/ directory next to the app as
+# its own multipage navigation.
+import importlib
+from collections import namedtuple
+
+from versioned_cache import VersionedCache
+
+Route = namedtuple('Route', ['slug', 'icon', 'label', 'module'])
+
+ROUTES = [
+    Route('home', '🏠', 'Home', 'views.home'),
+    Route('career', '💼', 'Career', 'views.career'),
+    Route('research', '🔬', 'Research', 'views.research'),
+    Route('projects', '💻', 'Projects', 'views.projects'),
+    Route('achievements', '🏆', 'Achievements', 'views.achievements'),
+    Route('patents', '📜', 'Patents', 'views.patents'),
+    Route('analytics', '📊', 'Analytics', 'views.analytics'),
+]
+ROUTES_BY_SLUG = {route.slug: route for route in ROUTES}
+DEFAULT_ROUTE = 'home'
+
+# Fragments of the build() views, one entry per (profile, page) and profile version
+page_cache = VersionedCache()
+
+# What a render() view gets: the loaded profile and the app's delta-counting render_html
+PageContext = namedtuple('PageContext', ['profile', 'stats', 'version', 'profile_key', 'render_html'])
+
+
+def route_for(slug):
+    """The route for ``slug``, or the default route for an unknown one."""
+    return ROUTES_BY_SLUG.get(slug) or ROUTES_BY_SLUG[DEFAULT_ROUTE]
+
+
+def load(route):
+    return importlib.import_module(route.module)
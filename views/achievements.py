@@ -0,0 +1,42 @@
+# Achievements page - awards grouped by category
+import components as ui
+from awards import categorize_awards
+
+
+def build(profile_data, profile_stats):
+    fragments = []
+    fragments.append(ui.hero('Achievements', 'Excellence Across Multiple Disciplines'))
+
+    categorized = categorize_awards(profile_data.get('honors_and_awards', []))
+
+    category_config = {
+        "Sports": {"icon": "🏋️", "section": "section-gradient-orange", "header": "section-header-orange"},
+        "Science": {"icon": "🔬", "section": "section-gradient-purple", "header": "section-header-purple"},
+        "Technology": {"icon": "💻", "section": "section-gradient-blue", "header": "section-header-blue"},
+        "Entrepreneurship": {"icon": "🚀", "section": "section-gradient-green", "header": "section-header-green"},
+        "Academic": {"icon": "🎓", "section": "section-gradient-pink", "header": "section-header-pink"},
+        "Chess": {"icon": "♟️", "section": "section-dark", "header": ""},
+        "Extra": {"icon": "✨", "section": "section-glass", "header": ""},
+    }
+
+    # Overview
+    active_cats = [(cat, awards) for cat, awards in categorized.items() if awards]
+    overview = ui.metric_tiles(((category_config.get(cat, {"icon": "🏆"})["icon"], len(awards), cat)
+                                for cat, awards in active_cats), icon_size='2rem')
+    fragments.append(ui.section('section-bordered', '📊', 'Achievement Overview', ui.grid('grid-auto', overview)))
+
+    # Each category in its own styled section
+    for category, awards in active_cats:
+        config = category_config.get(category, {"icon": "🏆", "section": "section-glass", "header": ""})
+
+        rows = [{
+            'title': award.get('title', ''),
+            'issuer': award.get('issuer', ''),
+            'date': award.get('issued_date', ''),
+            'desc': award.get('description', ''),
+        } for award in awards]
+        fragments.append(ui.Paged(f'awards_{category}', config["section"], config["icon"],
+                                  f'{category} ({len(awards)} awards)', config["header"], 'grid-2',
+                                  rows, ui.award_cards, page_size=10))
+
+    return fragments
@@ -0,0 +1,88 @@
+# Analytics page - summary tiles and the Plotly charts
+#
+# Not cached as a whole like the other pages: charts are Streamlit elements,
+# not HTML fragments. The frames and figures behind them are cached per
+# profile version (analytics.frames_cache, charts.figure_cache). The layout
+# (chart_rows) is plain data, shared with the static export (export_site.py).
+from collections import namedtuple
+
+import streamlit as st
+
+import analytics
+import charts
+import components as ui
+from timings import timings
+
+# A chart in its section; ``build`` makes the figure, or is None when there is nothing to plot
+Chart = namedtuple('Chart', ['name', 'css', 'header', 'icon', 'title', 'build'])
+
+
+def summary(stats):
+    tiles = [
+        ("🏆", stats.awards, "Awards"),
+        ("📜", stats.patents, "Patents"),
+        ("💻", stats.projects, "Projects"),
+        ("🎓", stats.certifications, "Certifications"),
+        ("💼", stats.positions, "Positions"),
+    ]
+    return ui.section('section-glass', '📈', 'Summary Statistics',
+                      ui.grid('grid-auto', ui.metric_tiles(tiles, icon_size='1.6rem')))
+
+
+def chart_rows(frames, stats):
+    """The charts in page order; charts in the same row sit side by side."""
+    has_years = frames.awards['year'].notna().any()
+    return [
+        [Chart('categories', 'section-gradient-purple', 'section-header-purple', '🎯', 'Achievement Distribution',
+               lambda: charts.category_pie(analytics.category_counts(frames))),
+         Chart('award_years', 'section-gradient-blue', 'section-header-blue', '📅', 'Awards Timeline',
+               (lambda: charts.award_year_bar(analytics.award_year_counts(frames))) if has_years else None)],
+        [Chart('issuers', 'section-dark', '', '🎖️', 'Certification Sources',
+               (lambda: charts.issuer_bar(stats.certification_issuers[:8]))
+               if stats.certification_issuers else None)],
+        [Chart('category_years', 'section-dark', '', '🗓️', 'Achievements by Category and Year',
+               (lambda: charts.category_year_heatmap(analytics.category_year_table(frames))) if has_years else None)],
+        [Chart('award_months', 'section-dark', '', '📆', 'Awards by Month',
+               (lambda: charts.award_month_bar(analytics.award_month_counts(frames)))
+               if frames.awards['month'].notna().any() else None)],
+    ]
+
+
+def chart_header(chart):
+    """Opens the chart's section; the caller closes it with </div> after the figure."""
+    return (f'<div class="{chart.css}"><h2 class="section-header {chart.header}">'
+            f'<span class="section-header-icon">{chart.icon}</span>{ui.text(chart.title)}</h2>')
+
+
+def figure(page, chart):
+    return charts.cached_figure(chart.name, page.version, chart.build, profile=page.profile_key)
+
+
+# Figures come from charts.figure_cache; what is left per rerun is Streamlit
+# serializing the stored figure, timed here
+def show_chart(name, fig):
+    with timings.measure(f'chart.{name}.ship'):
+        st.plotly_chart(fig, use_container_width=True)
+
+
+def show_section(page, chart):
+    page.render_html(chart_header(chart))
+    if chart.build is not None:
+        show_chart(chart.name, figure(page, chart))
+    page.render_html('</div>')
+
+
+def render(page):
+    render_html = page.render_html
+    render_html(ui.hero('Analytics Dashboard', 'Data-Driven Insights'))
+
+    frames = analytics.profile_frames(page.profile, page.version, page.profile_key)
+    render_html(summary(page.stats))
+
+    for row in chart_rows(frames, page.stats):
+        if len(row) == 1:
+            show_section(page, row[0])
+            continue
+        for col, chart in zip(st.columns(len(row)), row):
+            with col:
+                show_section(page, chart)
@@ -0,0 +1,40 @@
+# Career page - role stats and the professional timeline
+import components as ui
+import dates
+from textutils import item_text
+from thumbnails import thumbnail_cache
+
+
+def build(profile_data, profile_stats):
+    fragments = []
+    fragments.append(ui.hero('Career Journey', 'Professional Evolution & Leadership'))
+
+    # Career Stats
+    experiences = [e for e in profile_data.get('experience', []) if e.get('title') and e.get('title') != e.get('company_name')]
+
+    career_stats = [
+        ("💼", profile_stats.career_positions, "Total Positions"),
+        ("🚀", profile_stats.career_current, "Current Roles"),
+        ("🏢", profile_stats.companies, "Companies"),
+        ("📅", "6+", "Years Experience"),
+    ]
+    fragments.append(ui.grid('grid-4', ui.metric_tiles(career_stats)))
+
+    # Timeline section, latest role first: current roles (including any without an
+    # end date, shown as Present), then by end and start month
+    experiences = sorted(experiences, key=lambda e: (dates.end(e), dates.start(e)), reverse=True)
+    timeline = ui.timeline_items({
+        'title': exp.get('title', ''),
+        'company': exp.get('company_name', ''),
+        'start': exp.get('date', {}).get('start_date', ''),
+        'end': exp.get('date', {}).get('end_date', 'Present'),
+        'location': exp.get('location', ''),
+        'desc': item_text(exp, 'description', 350),
+        'logo': thumbnail_cache.url(exp.get('image_url')),
+    } for exp in experiences)
+    fragments.append(ui.section(
+        'section-glass', '📈', 'Professional Timeline',
+        f'<div class="timeline-container"><div class="timeline-line"></div>{"".join(timeline)}</div>',
+    ))
+
+    return fragments
@@ -0,0 +1,72 @@
+# Home page - hero, headline stats, current roles, education and recent activities
+import components as ui
+import dates
+from textutils import item_text
+from thumbnails import thumbnail_cache
+
+
+def build(profile_data, profile_stats):
+    fragments = []
+    # Hero
+    fragments.append(ui.hero(profile_data.get("name", "Alisher Beisembekov"),
+                             'Polymath · Tech Innovator · World Record Holder', floating=True))
+
+    # Stats Row
+    fragments.append("---")
+    stats = [
+        ("🏆", profile_stats.awards, "Awards"),
+        ("📜", profile_stats.patents, "Patents"),
+        ("💻", profile_stats.projects, "Projects"),
+        ("📚", profile_stats.publications, "Publications"),
+        ("🎓", profile_stats.certifications, "Certifications"),
+    ]
+    fragments.append(ui.grid('grid-auto', ui.metric_tiles(stats, icon_size='2rem', icon_style=' margin-bottom: 8px;')))
+
+    # About Section
+    description = profile_data.get('description', '')
+    fragments.append(ui.section(
+        'section-gradient-purple', '👤', 'About',
+        f'<p class="text-white" style="font-size: 1.05rem; line-height: 1.8;">{ui.text(description)}</p>',
+        header='section-header-purple',
+    ))
+
+    # Two columns: Current Roles + Education/Languages
+    current_positions = [e for e in profile_data.get('experience', []) if e.get('title') and dates.is_current(e)]
+
+    roles = ui.role_cards({
+        'title': pos.get('title', ''),
+        'company': pos.get('company_name', ''),
+        'start': pos.get('date', {}).get('start_date', ''),
+        'desc': item_text(pos, 'description', 180),
+    } for pos in current_positions[:5])
+
+    # Education
+    education = ui.education_cards({
+        'degree': edu.get('degree', ''),
+        'major': edu.get('major', ''),
+        'school': edu.get('university_name', ''),
+        'start': edu.get('date', {}).get('start_date', ''),
+        'end': edu.get('date', {}).get('end_date', ''),
+    } for edu in profile_data.get('education', []))
+
+    # Languages
+    langs_html = ui.tags(((lang.get('name', ''), lang['description'].split()[0] if lang.get('description') else '')
+                          for lang in profile_data.get('languages', [])), note_css='text-xs')
+
+    fragments.append(ui.Columns([3, 2], [
+        [ui.section('section-glass', '🚀', 'Current Roles', ''.join(roles))],
+        [ui.section('section-gradient-blue', '🎓', 'Education', ''.join(education), header='section-header-blue'),
+         ui.section('section-gradient-green', '🌍', 'Languages', f'<div>{langs_html}</div>',
+                    header='section-header-green')],
+    ]))
+
+    # Recent Activities
+    activities = profile_data.get('activities', [])
+    if activities:
+        cards = ui.thumb_cards(
+            ((a.get('title', '')[:60], a.get('subtitle', '')[:40], thumbnail_cache.url(a.get('image_url')))
+             for a in activities[:8]),
+            min_height='80px')
+        fragments.append(ui.section('section-dark', '📰', 'Recent Activities', ui.grid('grid-4', cards)))
+
+    return fragments
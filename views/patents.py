@@ -0,0 +1,24 @@
+# Patents page - patent stats and the registered patents
+import components as ui
+
+
+def build(profile_data, profile_stats):
+    fragments = []
+    fragments.append(ui.hero('Patent Portfolio', 'Intellectual Property & Innovations'))
+
+    patents = profile_data.get('patents', [])
+
+    # Stats
+    patent_stats = [
+        ("📜", profile_stats.patents, "Total Patents"),
+        ("🇰🇿", profile_stats.patents_kz, "Kazakhstan"),
+        ("💡", profile_stats.patents, "Innovations"),
+    ]
+    fragments.append(ui.grid('grid-3', ui.metric_tiles(patent_stats)))
+
+    cards = ui.patent_cards({'title': p.get('title', ''), 'patent_id': p.get('patent_id', '')} for p in patents)
+    fragments.append(ui.section('section-gradient-orange', '📜', 'Registered Patents', ui.grid('grid-2', cards),
+                                header='section-header-orange'))
+
+    return fragments
+
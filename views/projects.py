@@ -0,0 +1,42 @@
+# Projects page - project stats, featured projects and the other projects grid
+import components as ui
+from textutils import item_text
+
+
+def build(profile_data, profile_stats):
+    fragments = []
+    fragments.append(ui.hero('Innovation Portfolio', 'Building Tomorrow\'s Technology'))
+
+    projects = [p for p in profile_data.get('projects', []) if p.get('name')]
+    projects_with_desc = [p for p in projects if p.get('description')]
+
+    # Stats
+    proj_stats = [
+        ("💡", profile_stats.projects, "Total Projects"),
+        ("📝", profile_stats.projects_documented, "Documented"),
+        ("🚀", profile_stats.projects_active, "Active"),
+    ]
+    fragments.append(ui.grid('grid-3', ui.metric_tiles(proj_stats)))
+
+    # Featured Projects (with descriptions)
+    featured = []
+    for project in projects_with_desc[:12]:
+        date_info = project.get('date') or {}
+        start = date_info.get('start_date', '')
+        end = date_info.get('end_date', '')
+        featured.append({
+            'name': project.get('name', ''),
+            'desc': item_text(project, 'description', 400, strip_emoji=True),
+            'period': f"{start} - {end if end else 'Present'}" if start else "",
+        })
+    fragments.append(ui.section('section-gradient-green', '⭐', 'Featured Projects', ''.join(ui.project_cards(featured)),
+                                header='section-header-green'))
+
+    # Other Projects Grid
+    other_projects = [p for p in projects if not p.get('description') and p.get('name')]
+    if other_projects:
+        rows = [(proj.get('name', ''), (proj.get('date') or {}).get('start_date') or '') for proj in other_projects]
+        fragments.append(ui.Paged('other_projects', 'section-dark', '📂', f'Other Projects ({len(rows)})', '',
+                                  'grid-3', rows, ui.compact_cards, page_size=18))
+
+    return fragments
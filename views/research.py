@@ -0,0 +1,35 @@
+# Research page - publications, certifications and expertise areas
+import components as ui
+import dates
+
+
+def build(profile_data, profile_stats):
+    fragments = []
+    fragments.append(ui.hero('Research & Knowledge', 'Publications · Certifications · Expertise'))
+
+    # Publications Section
+    publications = ui.publication_cards({
+        'title': pub.get('title', ''),
+        'publisher': pub.get('publisher', ''),
+        'date': pub.get('publication_date', ''),
+        'desc': pub.get('description', ''),
+    } for pub in profile_data.get('publications', []))
+    fragments.append(ui.section('section-gradient-purple', '📚', 'Publications', ''.join(publications),
+                                header='section-header-purple'))
+
+    # Certifications Section
+    certifications = [{
+        'title': cert.get('title', ''),
+        'issuer': cert.get('issuer', ''),
+        'issued': dates.issued_label(cert),
+        'credential': cert.get('credential', ''),
+    } for cert in profile_data.get('certifications', [])]
+    fragments.append(ui.Paged('certifications', 'section-gradient-blue', '🎖️',
+                              f'Certifications ({profile_stats.certifications})', 'section-header-blue', 'grid-2',
+                              certifications, ui.certification_cards, page_size=12))
+
+    # Skills from certifications
+    tags_html = ui.tags(profile_stats.certification_issuers)
+    fragments.append(ui.section('section-dark', '🛠️', 'Expertise Areas', f'<div>{tags_html}</div>'))
+
+    return fragments